@@ -1,6 +1,6 @@
 """Bookmark manager package for managing bookmarks with plain text files."""
 
 from .cli import main
-from .models import Bookmark, BookmarkManager
+from .models import Bookmark, BookmarkManager, Config
 
-__all__ = ["Bookmark", "BookmarkManager", "main"]
+__all__ = ["Bookmark", "BookmarkManager", "Config", "main"]
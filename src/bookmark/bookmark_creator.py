@@ -1,10 +1,11 @@
 """Bookmark creation workflow with interactive prompts."""
 
 import sys
+from functools import cached_property
 from pathlib import Path
 
 from .file_manager import BookmarkFileManager
-from .fzf_interface import FZFInterface, TagInput
+from .fzf_interface import TagInput, get_fzf_interface
 from .models import Bookmark, BookmarkManager
 
 
@@ -19,27 +20,68 @@ class BookmarkCreator:
         self,
         file_manager: BookmarkFileManager,
         bookmark_file_path: Path | None = None,
+        bookmark_manager: BookmarkManager | None = None,
     ) -> None:
         """Initialize the bookmark creator.
 
         Args:
             file_manager: File manager for handling bookmark operations
             bookmark_file_path: Optional specific bookmark file path
+            bookmark_manager: Optional existing manager to write through,
+                which also supplies the bookmark file if none is given
+
+        Raises:
+            ValueError: If bookmark_manager uses a different bookmark file
+                than bookmark_file_path
         """
+        # A manager writes to its own file, so a conflicting path would be
+        # silently ignored for writes while still shown to the user
+        if (
+            bookmark_manager is not None
+            and bookmark_file_path is not None
+            and bookmark_manager.bookmark_file != bookmark_file_path
+        ):
+            raise ValueError(
+                f"bookmark_manager uses {bookmark_manager.bookmark_file}, "
+                f"not {bookmark_file_path}",
+            )
+
         self.file_manager = file_manager
-        self.fzf_interface = FZFInterface()
+        self.fzf_interface = get_fzf_interface()
         self.tag_input = TagInput(self.fzf_interface)
 
-        # Determine bookmark file to use
-        if bookmark_file_path:
-            self.bookmark_file = bookmark_file_path
-        else:
-            # Use config file to determine default
-            config = file_manager.read_config()
-            default_file = config.get("default_bookmark_file", "bookmarks.txt")
-            self.bookmark_file = file_manager.get_bookmark_file_path(default_file)
+        # The bookmark file is resolved on first use, so workflows that end
+        # early never read the config just to pick a default file
+        self._bookmark_file_override = bookmark_file_path
+
+        # Reuse a caller's manager, keeping the state it has already built up
+        if bookmark_manager is not None:
+            self.bookmark_manager = bookmark_manager
+            if bookmark_file_path is None:
+                self._bookmark_file_override = bookmark_manager.bookmark_file
 
-        self.bookmark_manager = BookmarkManager(self.bookmark_file)
+    @cached_property
+    def bookmark_file(self) -> Path:
+        """Resolve the bookmark file to use.
+
+        Returns:
+            The explicit bookmark file path, or the config's default file
+        """
+        if self._bookmark_file_override:
+            return self._bookmark_file_override
+
+        # Use config file to determine default
+        config = self.file_manager.read_config()
+        return self.file_manager.get_bookmark_file_path(config.default_bookmark_file)
+
+    @cached_property
+    def bookmark_manager(self) -> BookmarkManager:
+        """Create the bookmark manager for the resolved bookmark file.
+
+        Returns:
+            Bookmark manager bound to bookmark_file
+        """
+        return BookmarkManager(self.bookmark_file)
 
     def create_bookmark(self) -> bool:
         """Run the interactive bookmark creation workflow.
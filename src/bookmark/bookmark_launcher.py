@@ -1,13 +1,18 @@
 """Bookmark launch workflow with FZF selection and browser integration."""
 
+import contextlib
+import shlex
+import shutil
 import subprocess
 import sys
 import webbrowser
+from collections.abc import Iterator, Sequence
+from functools import cached_property
 from pathlib import Path
 
 from .file_manager import BookmarkFileManager
-from .fzf_interface import FZFInterface
-from .models import BookmarkManager
+from .fzf_interface import get_fzf_interface
+from .models import Bookmark, BookmarkManager
 
 
 class BookmarkLauncher:
@@ -31,19 +36,38 @@ class BookmarkLauncher:
             browser_command: Optional browser command override
         """
         self.file_manager = file_manager
-        self.fzf_interface = FZFInterface()
+        self.fzf_interface = get_fzf_interface()
         self.browser_command = browser_command
 
-        # Determine bookmark file to use
-        if bookmark_file_path:
-            self.bookmark_file = bookmark_file_path
-        else:
-            # Use config file to determine default
-            config = file_manager.read_config()
-            default_file = config.get("default_bookmark_file", "bookmarks.txt")
-            self.bookmark_file = file_manager.get_bookmark_file_path(default_file)
+        # Browser argument list resolved against PATH on first launch
+        self._resolved_browser: list[str] | None = None
+
+        # The bookmark file is resolved on first use, so workflows that end
+        # early never read the config just to pick a default file
+        self._bookmark_file_override = bookmark_file_path
+
+    @cached_property
+    def bookmark_file(self) -> Path:
+        """Resolve the bookmark file to use.
+
+        Returns:
+            The explicit bookmark file path, or the config's default file
+        """
+        if self._bookmark_file_override:
+            return self._bookmark_file_override
+
+        # Use config file to determine default
+        config = self.file_manager.read_config()
+        return self.file_manager.get_bookmark_file_path(config.default_bookmark_file)
 
-        self.bookmark_manager = BookmarkManager(self.bookmark_file)
+    @cached_property
+    def bookmark_manager(self) -> BookmarkManager:
+        """Create the bookmark manager for the resolved bookmark file.
+
+        Returns:
+            Bookmark manager bound to bookmark_file
+        """
+        return BookmarkManager(self.bookmark_file)
 
     def launch_bookmark(self) -> bool:
         """Run the interactive bookmark selection and launch workflow.
@@ -55,7 +79,9 @@ class BookmarkLauncher:
             # Ensure base directory exists
             self.file_manager.ensure_base_directory()
 
-            # Read bookmarks
+            # Resolve the bookmark file and config and parse every bookmark
+            # before FZF starts: it owns the terminal while open, and config
+            # or malformed-line warnings must not land on top of its UI
             try:
                 bookmarks = self.bookmark_manager.read_bookmarks()
             except (PermissionError, OSError) as e:
@@ -71,27 +97,41 @@ class BookmarkLauncher:
 
             # Get display configuration
             config = self.file_manager.read_config()
-            display_fields = config.get(
-                "display_fields", ["name", "description", "url"],
+            display_fields = config.display_fields
+
+            # Cap how many bookmarks go to FZF so the UI stays responsive
+            # on very large files
+            total_bookmarks = len(bookmarks)
+            max_results = config.max_fzf_results
+            if max_results and total_bookmarks > max_results:
+                bookmarks = bookmarks[:max_results]
+
+            # Format bookmarks lazily as FZF consumes them, remembering which
+            # bookmark produced each line so the selection maps back with a
+            # single lookup
+            line_to_bookmark: dict[str, Bookmark] = {}
+            bookmark_lines = self._iter_display_lines(
+                bookmarks, display_fields, line_to_bookmark,
             )
 
-            # Format bookmarks for display
-            bookmark_lines = []
-            for bookmark in bookmarks:
-                display_line = bookmark.matches_display_format(display_fields)
-                bookmark_lines.append(display_line)
+            # Use FZF to select bookmark, resolving the browser while the user
+            # is still choosing so the launch starts immediately
+            selected_line = self.fzf_interface.select_bookmark(
+                bookmark_lines, while_waiting=self._prepare_browser,
+            )
+
+            if len(bookmarks) < total_bookmarks:
+                print(
+                    f"Warning: Showed the first {len(bookmarks)} of "
+                    f"{total_bookmarks} bookmarks (see max_fzf_results).",
+                    file=sys.stderr,
+                )
 
-            # Use FZF to select bookmark
-            selected_line = self.fzf_interface.select_bookmark(bookmark_lines)
             if not selected_line:
                 return False
 
             # Find the corresponding bookmark
-            selected_bookmark = None
-            for i, line in enumerate(bookmark_lines):
-                if line == selected_line:
-                    selected_bookmark = bookmarks[i]
-                    break
+            selected_bookmark = line_to_bookmark.get(selected_line)
 
             if not selected_bookmark:
                 print("Error: Could not find selected bookmark.", file=sys.stderr)
@@ -104,6 +144,31 @@ class BookmarkLauncher:
             print("\nBookmark selection cancelled.")
             return False
 
+    def _iter_display_lines(
+        self,
+        bookmarks: list[Bookmark],
+        display_fields: Sequence[str],
+        line_to_bookmark: dict[str, Bookmark],
+    ) -> Iterator[str]:
+        """Yield display lines for bookmarks, recording each line's bookmark.
+
+        Each line is registered in line_to_bookmark before it is yielded, so any
+        line FZF can return is already mapped back to its bookmark.
+
+        Args:
+            bookmarks: Bookmarks to format
+            display_fields: Field names to include in each line
+            line_to_bookmark: Mapping filled in as lines are produced
+
+        Yields:
+            Formatted bookmark lines for display
+        """
+        for bookmark in bookmarks:
+            display_line = bookmark.matches_display_format(display_fields)
+            # Keep the first bookmark for duplicate lines, as the old scan did
+            line_to_bookmark.setdefault(display_line, bookmark)
+            yield display_line
+
     def _launch_url(self, url: str) -> bool:
         """Launch a URL in the appropriate browser.
 
@@ -122,13 +187,25 @@ class BookmarkLauncher:
             browser_cmd = self._get_browser_command()
 
             if browser_cmd:
-                # Use custom browser command
-                if isinstance(browser_cmd, str):
-                    # Simple string command
-                    subprocess.run([browser_cmd, url], check=True)
-                else:
-                    # List command
-                    subprocess.run(browser_cmd + [url], check=True)
+                # Use custom browser command, failing fast if it isn't on PATH
+                browser_argv = self._resolve_browser_argv(browser_cmd)
+                if browser_argv is None:
+                    print(
+                        f"Error launching browser: command not found: {browser_cmd}",
+                        file=sys.stderr,
+                    )
+                    return False
+                command = browser_argv + [url]
+
+                # Start the browser detached and don't wait for it, matching
+                # webbrowser.open() so the CLI returns immediately
+                subprocess.Popen(
+                    command,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
             else:
                 # Use system default browser
                 webbrowser.open(url)
@@ -136,18 +213,64 @@ class BookmarkLauncher:
             print(f"Launched: {url}")
             return True
 
-        except subprocess.CalledProcessError as e:
-            print(f"Error launching browser: {e}", file=sys.stderr)
+        except FileNotFoundError as e:
+            print(f"Error launching browser: command not found: {e}", file=sys.stderr)
             return False
         except Exception as e:
             print(f"Error opening URL: {e}", file=sys.stderr)
             return False
 
-    def _get_browser_command(self) -> str | None:
+    def _prepare_browser(self) -> None:
+        """Resolve and cache the browser command ahead of launching.
+
+        Runs while FZF is on screen, so it must not print or raise; this is
+        only a prefetch, and _launch_url() reports any problem once FZF has
+        closed.
+        """
+        browser_cmd = self._get_browser_command()
+        if not browser_cmd:
+            return
+
+        # A malformed command, e.g. unbalanced quotes rejected by shlex, is
+        # left for _launch_url() to report
+        with contextlib.suppress(ValueError):
+            self._resolve_browser_argv(browser_cmd)
+
+    def _resolve_browser_argv(
+        self, browser_cmd: str | Sequence[str],
+    ) -> list[str] | None:
+        """Resolve a browser command to an argument list with a full executable path.
+
+        The PATH lookup happens once per launcher; the result is reused by
+        later launches.
+
+        Args:
+            browser_cmd: Browser command string (may include arguments) or list
+
+        Returns:
+            Argument list to which the URL is appended, or None if not found
+        """
+        if self._resolved_browser is not None:
+            return self._resolved_browser
+
+        # Split string commands so configs like "google-chrome --new-tab" work
+        if isinstance(browser_cmd, str):
+            argv = shlex.split(browser_cmd)
+        else:
+            argv = list(browser_cmd)
+
+        executable = shutil.which(argv[0]) if argv else None
+        if executable is None:
+            return None
+
+        self._resolved_browser = [executable, *argv[1:]]
+        return self._resolved_browser
+
+    def _get_browser_command(self) -> str | Sequence[str] | None:
         """Determine which browser command to use.
 
         Returns:
-            Browser command string, or None for system default
+            Browser command string or argument list, or None for system default
         """
         # CLI option takes precedence
         if self.browser_command:
@@ -155,7 +278,7 @@ class BookmarkLauncher:
 
         # Check config file
         config = self.file_manager.read_config()
-        config_browser = config.get("browser")
+        config_browser = config.browser
         if config_browser:
             return config_browser
 
@@ -185,19 +308,17 @@ class BookmarkLauncher:
 
             # Get display configuration
             config = self.file_manager.read_config()
-            display_fields = config.get(
-                "display_fields", ["name", "description", "url"],
-            )
+            display_fields = config.display_fields
 
-            # Print header
+            # Build header and bookmark lines, then emit them in one write
+            # rather than one print() per bookmark
             header = "|".join(field.upper() for field in display_fields)
-            print(header)
-            print("-" * len(header))
-
-            # Print bookmarks
-            for bookmark in bookmarks:
-                display_line = bookmark.matches_display_format(display_fields)
-                print(display_line)
+            lines = [header, "-" * len(header)]
+            lines.extend(
+                bookmark.matches_display_format(display_fields)
+                for bookmark in bookmarks
+            )
+            sys.stdout.write("\n".join(lines) + "\n")
 
             return True
 
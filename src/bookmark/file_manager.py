@@ -1,10 +1,31 @@
 """File management utilities for the bookmark manager."""
 
+import os
 import sys
+from collections import OrderedDict
 from pathlib import Path
 
 import yaml
 
+from .models import Config
+
+# Prefer the libyaml-backed loader, falling back to pure Python when PyYAML
+# was built without it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Buffer size for sequential line-by-line scans; larger than the 8 KiB
+# default to cut read() syscalls on big files
+_READ_BUFFER_SIZE = 128 * 1024
+
+# Parsed config files keyed by path, each stored with the (mtime, size) stamp
+# it was parsed at, so managers in the same process skip re-parsing unchanged
+# files. Kept in least-recently-used order and capped at _CONFIG_CACHE_SIZE
+_CONFIG_CACHE: OrderedDict[Path, tuple[tuple[int, int], Config]] = OrderedDict()
+_CONFIG_CACHE_SIZE = 100
+
 
 class BookmarkFileManager:
     """Manages bookmark directory structure and file operations.
@@ -27,17 +48,37 @@ class BookmarkFileManager:
             home = Path.home()
             self.base_dir = home / ".bookmarks"
 
+        self._base_dir_str = str(self.base_dir)
         self.tags_file = self.base_dir / "tags.txt"
         self.config_file = self.base_dir / "config.yaml"
 
+        # Parsed config is memoized for the lifetime of this manager, since a
+        # single CLI invocation never expects config.yaml to change under it
+        self._config_cache: Config | None = None
+
+        # Known tags, loaded from tags.txt on first use and kept in step with
+        # every update_tags() write, so later calls skip re-reading the file
+        self._tag_cache: set[str] | None = None
+
+        # Set once the base directory is known to exist, so repeated calls to
+        # ensure_base_directory() within one process skip the mkdir syscall
+        self._base_dir_ensured = False
+
     def ensure_base_directory(self) -> None:
         """Ensure the base bookmarks directory exists.
 
+        Only the first successful call touches the filesystem; later calls on
+        the same manager return immediately.
+
         Raises:
             PermissionError: If directory cannot be created
         """
+        if self._base_dir_ensured:
+            return
+
         try:
             self.base_dir.mkdir(parents=True, exist_ok=True)
+            self._base_dir_ensured = True
         except PermissionError as e:
             print(
                 f"Error: Cannot create bookmarks directory {self.base_dir}: {e}",
@@ -63,84 +104,152 @@ class BookmarkFileManager:
         if filename is None:
             filename = "bookmarks.txt"
 
-        # If filename is just a name (no path), put it in the base directory
-        if "/" not in filename and "\\" not in filename:
-            return self.base_dir / filename
-        # If it's a path, treat it as relative to base directory
-        return self.base_dir / filename
+        # Plain names and relative paths both resolve under the base directory;
+        # joining strings avoids building intermediate Path objects
+        return Path(os.path.join(self._base_dir_str, filename))
 
     def read_tags(self) -> list[str]:
         """Read available tags from tags.txt.
 
+        The file is read at most once per manager for completion; later calls
+        reuse the tags loaded then, plus any written through update_tags().
+
         Returns:
             List of available tags sorted alphabetically
         """
+        return sorted(self._known_tags())
+
+    def _known_tags(self) -> set[str]:
+        """Return the cached set of known tags, loading it on first use.
+
+        Returns:
+            The manager's tag set; callers must not mutate it
+        """
+        if self._tag_cache is None:
+            self._tag_cache = self._read_tag_set()
+        return self._tag_cache
+
+    def _read_tag_set(self) -> set[str]:
+        """Read the unique, lowercased tags from tags.txt without sorting them.
+
+        Returns:
+            Set of available tags, empty if the file is missing or unreadable
+        """
         if not self.tags_file.exists():
-            return []
+            return set()
 
         try:
-            with open(self.tags_file, encoding="utf-8") as f:
-                tags = [line.strip().lower() for line in f if line.strip()]
-                return sorted(set(tags))  # Remove duplicates and sort
+            # newline="" skips newline translation; strip() below drops any
+            # "\r" left over from CRLF files
+            with open(
+                self.tags_file,
+                encoding="utf-8",
+                newline="",
+                buffering=_READ_BUFFER_SIZE,
+            ) as f:
+                # Strip and lowercase each line once, deduplicating as we go
+                return {tag for line in f if (tag := line.strip().lower())}
         except (PermissionError, OSError) as e:
             print(f"Warning: Cannot read tags file: {e}", file=sys.stderr)
-            return []
+            return set()
 
     def update_tags(self, new_tags: list[str]) -> None:
         """Update the tags file with new tags.
 
+        tags.txt is re-read right before merging, so tags written by another
+        process since read_tags() was called are kept. The file is only
+        rewritten when at least one tag is not already in it.
+
         Args:
             new_tags: List of new tags to add
         """
-        if not new_tags:
+        # Normalize new tags to lowercase, dropping blanks
+        new_tag_set = {tag.lower().strip() for tag in new_tags if tag.strip()}
+        if not new_tag_set:
             return
 
-        # Read existing tags
-        existing_tags = self.read_tags()
+        # Merge into the tags currently on disk rather than the completion
+        # cache, skipping the rewrite if nothing new was added
+        existing_tags = self._read_tag_set()
+        if new_tag_set.issubset(existing_tags):
+            self._tag_cache = existing_tags
+            return
 
-        # Add new tags (normalized to lowercase)
-        all_tags = existing_tags + [tag.lower().strip() for tag in new_tags]
-        unique_tags = sorted(set(all_tags))
+        # Sort once, at write time
+        merged_tags = existing_tags | new_tag_set
+        unique_tags = sorted(merged_tags)
 
         # Write back to file
         try:
             self.ensure_base_directory()
-            with open(self.tags_file, "w", encoding="utf-8") as f:
-                f.writelines(f"{tag}\n" for tag in unique_tags)
+            with open(self.tags_file, "w", encoding="utf-8", newline="") as f:
+                # unique_tags is never empty here, so one write covers it all
+                f.write("\n".join(unique_tags) + "\n")
         except (PermissionError, OSError) as e:
             print(f"Warning: Cannot update tags file: {e}", file=sys.stderr)
+            return
 
-    def read_config(self) -> dict:
+        # Only remember the new tags once they are on disk
+        self._tag_cache = merged_tags
+
+    def read_config(self) -> Config:
         """Read configuration from config.yaml.
 
+        The file is parsed at most once per manager; later calls return the
+        same immutable Config until invalidate_config() is called.
+
         Returns:
-            Configuration dictionary with defaults
+            Configuration with defaults for any unset fields
         """
-        default_config = {
-            "display_fields": ["name", "description", "url"],
-            "browser": None,
-            "default_bookmark_file": "bookmarks.txt",
-        }
+        if self._config_cache is None:
+            self._config_cache = self._load_config()
+        return self._config_cache
+
+    def invalidate_config(self) -> None:
+        """Discard the cached configuration so the next read re-parses the file."""
+        self._config_cache = None
+        # Drop the shared entry too; an edit that keeps the file's size and
+        # mtime would otherwise still match its stamp
+        _CONFIG_CACHE.pop(self.config_file, None)
+
+    def _load_config(self) -> Config:
+        """Load and validate configuration from config.yaml.
 
-        if not self.config_file.exists():
-            return default_config
+        Successful parses are shared process-wide and reused while the file's
+        modification time and size are unchanged.
 
+        Returns:
+            Configuration with defaults for any unset fields
+        """
         try:
+            # Reuse an earlier parse if the file is unchanged since then
+            stat = self.config_file.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            cached = _CONFIG_CACHE.get(self.config_file)
+            if cached is not None and cached[0] == stamp:
+                _CONFIG_CACHE.move_to_end(self.config_file)
+                return cached[1]
+
             with open(self.config_file, encoding="utf-8") as f:
-                config = yaml.safe_load(f)
-                if config is None:
-                    return default_config
-
-                # Merge with defaults
-                result = default_config.copy()
-                result.update(config)
-                return result
+                config = Config.from_mapping(yaml.load(f, Loader=_SafeLoader))
+
+            # Config is immutable, so callers can share the cached instance
+            _CONFIG_CACHE[self.config_file] = (stamp, config)
+            _CONFIG_CACHE.move_to_end(self.config_file)
+            if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+                _CONFIG_CACHE.popitem(last=False)
+            return config
+        except FileNotFoundError:
+            return Config()
         except (PermissionError, OSError) as e:
             print(f"Warning: Cannot read config file: {e}", file=sys.stderr)
-            return default_config
+            return Config()
         except yaml.YAMLError as e:
             print(f"Warning: Invalid YAML in config file: {e}", file=sys.stderr)
-            return default_config
+            return Config()
+        except (TypeError, ValueError) as e:
+            print(f"Warning: Invalid config file: {e}", file=sys.stderr)
+            return Config()
 
 
 class ProjectTestFileManager(BookmarkFileManager):
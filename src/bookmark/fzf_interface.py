@@ -1,7 +1,109 @@
 """FZF integration for bookmark selection and tag autocompletion."""
 
+import contextlib
 import subprocess
 import sys
+import threading
+from collections.abc import Callable, Iterable
+from functools import cache
+from itertools import chain
+
+
+class FZFSession:
+    """A running FZF process that is fed its input after it has started.
+
+    Starting the process first lets its fork/exec overlap with whatever work
+    produces the input lines.
+    """
+
+    def __init__(self, fzf_cmd: list[str]) -> None:
+        """Start FZF with piped stdin, stdout and stderr.
+
+        Args:
+            fzf_cmd: FZF command line to execute
+        """
+        self.process = subprocess.Popen(
+            fzf_cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+        )
+        self._feeder: threading.Thread | None = None
+
+    def _feed_lines(self, lines: Iterable[str]) -> None:
+        """Write lines to FZF's stdin as they are produced.
+
+        Writing directly avoids materializing a second, joined copy of the
+        input. Stdin is closed once the lines are exhausted so FZF sees EOF.
+
+        Args:
+            lines: Lines to send, without trailing newlines
+        """
+        try:
+            self.process.stdin.writelines(f"{line}\n" for line in lines)
+        except BrokenPipeError:
+            # FZF exited before reading everything (e.g. the user cancelled)
+            pass
+        finally:
+            with contextlib.suppress(BrokenPipeError):
+                self.process.stdin.close()
+
+    def feed(self, lines: Iterable[str]) -> None:
+        """Stream lines into FZF from a background producer thread.
+
+        Args:
+            lines: Lines to send, without trailing newlines
+        """
+        self._feeder = threading.Thread(
+            target=self._feed_lines, args=(lines,), daemon=True,
+        )
+        self._feeder.start()
+
+    def finish(
+        self, while_waiting: Callable[[], object] | None = None,
+    ) -> tuple[int, str, str]:
+        """Wait for the user's selection and collect FZF's output.
+
+        Args:
+            while_waiting: Optional callable run on this thread while FZF is
+                open, for work the caller needs after the selection
+
+        Returns:
+            Tuple of (return code, stdout, stderr)
+        """
+        # Overlap the caller's follow-up work with the user's interaction
+        if while_waiting is not None:
+            while_waiting()
+
+        # communicate() would close stdin under the feeder, so read the
+        # output pipes directly instead
+        stdout = self.process.stdout.read()
+        stderr = self.process.stderr.read()
+        self.process.wait()
+        if self._feeder is not None:
+            self._feeder.join()
+
+        return self.process.returncode, stdout, stderr
+
+    def cancel(self) -> None:
+        """Stop FZF if it is still running and release its pipes.
+
+        Cancels a session that has nothing to show, and is safe to call after
+        finish() so callers can use it unconditionally for cleanup.
+        """
+        if self.process.poll() is None:
+            self.process.terminate()
+        self.process.wait()
+        if self._feeder is not None:
+            self._feeder.join()
+
+        # Release the pipes; stdin may already be closed by the feeder
+        with contextlib.suppress(BrokenPipeError):
+            self.process.stdin.close()
+        self.process.stdout.close()
+        self.process.stderr.close()
 
 
 class FZFInterface:
@@ -11,9 +113,15 @@ class FZFInterface:
     ensuring a smooth user experience for finding and selecting items.
     """
 
+    # Whether FZF has already been found in this process; probing spawns a
+    # subprocess, so only the first instance pays for it
+    _fzf_checked: bool = False
+
     def __init__(self) -> None:
         """Initialize the FZF interface."""
-        self._check_fzf_availability()
+        if not FZFInterface._fzf_checked:
+            self._check_fzf_availability()
+            FZFInterface._fzf_checked = True
 
     def _check_fzf_availability(self) -> None:
         """Check if FZF is available on the system.
@@ -39,51 +147,110 @@ class FZFInterface:
             )
             sys.exit(1)
 
+    def _run_fzf(
+        self,
+        fzf_cmd: list[str],
+        lines: Iterable[str],
+        while_waiting: Callable[[], object] | None = None,
+    ) -> tuple[int, str, str]:
+        """Run FZF while a background thread streams lines into it.
+
+        FZF starts indexing and accepting keystrokes as soon as the first line
+        arrives, so any lazy formatting done by the caller's iterable overlaps
+        with the user's interaction instead of preceding it.
+
+        Args:
+            fzf_cmd: FZF command line to execute
+            lines: Lines to send, without trailing newlines
+            while_waiting: Optional callable run on this thread while FZF is
+                open, for work the caller needs after the selection
+
+        Returns:
+            Tuple of (return code, stdout, stderr)
+        """
+        session = FZFSession(fzf_cmd)
+        try:
+            session.feed(lines)
+            return session.finish(while_waiting)
+        finally:
+            # Never leave FZF or the feeder running if finishing failed
+            session.cancel()
+
+    def _bookmark_command(self, prompt: str) -> list[str]:
+        """Build the FZF command line for bookmark selection.
+
+        Args:
+            prompt: Prompt text for FZF
+
+        Returns:
+            FZF command line
+        """
+        return [
+            "fzf",
+            "--prompt",
+            prompt,
+            "--height",
+            "40%",
+            "--reverse",
+            "--border",
+            "--info=inline",
+        ]
+
+    def begin_select_bookmark(self, prompt: str = "Select bookmark: ") -> FZFSession:
+        """Start FZF for bookmark selection before its input is ready.
+
+        Lets the caller overlap FZF's startup with loading bookmarks; pass the
+        returned session to select_bookmark() once the lines are available.
+
+        Args:
+            prompt: Prompt text for FZF
+
+        Returns:
+            Running FZF session awaiting input
+        """
+        return FZFSession(self._bookmark_command(prompt))
+
     def select_bookmark(
-        self, bookmark_lines: list[str], prompt: str = "Select bookmark: ",
+        self,
+        bookmark_lines: Iterable[str],
+        prompt: str = "Select bookmark: ",
+        while_waiting: Callable[[], object] | None = None,
+        session: FZFSession | None = None,
     ) -> str | None:
-        """Use FZF to select a bookmark from a list.
+        """Use FZF to select a bookmark from a stream of lines.
 
         Args:
-            bookmark_lines: List of formatted bookmark lines for display
-            prompt: Prompt text for FZF
+            bookmark_lines: Formatted bookmark lines for display, consumed lazily
+            prompt: Prompt text for FZF (ignored when session is given)
+            while_waiting: Optional callable run while the user is selecting,
+                e.g. to warm caches needed once a bookmark is chosen
+            session: FZF session from begin_select_bookmark() to feed instead
+                of starting a new process
 
         Returns:
             Selected bookmark line, or None if cancelled
         """
-        if not bookmark_lines:
+        # Peek at the first line so an empty input never launches FZF
+        lines = iter(bookmark_lines)
+        first_line = next(lines, None)
+        if first_line is None:
+            if session is not None:
+                session.cancel()
             print("No bookmarks available.")
             return None
 
         try:
-            # Create FZF process
-            fzf_cmd = [
-                "fzf",
-                "--prompt",
-                prompt,
-                "--height",
-                "40%",
-                "--reverse",
-                "--border",
-                "--info=inline",
-            ]
+            # Create FZF process, unless the caller already started one
+            if session is None:
+                session = self.begin_select_bookmark(prompt)
 
-            process = subprocess.Popen(
-                fzf_cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                encoding="utf-8",
-            )
+            # Stream bookmark lines to FZF as the caller produces them
+            session.feed(chain((first_line,), lines))
+            returncode, stdout, stderr = session.finish(while_waiting)
 
-            # Send bookmark lines to FZF
-            input_data = "\n".join(bookmark_lines)
-            stdout, stderr = process.communicate(input=input_data)
-
-            if process.returncode == 0:
+            if returncode == 0:
                 return stdout.strip()
-            if process.returncode == 130:  # Ctrl+C
+            if returncode == 130:  # Ctrl+C
                 return None
             print(f"FZF error: {stderr}", file=sys.stderr)
             return None
@@ -92,40 +259,10 @@ class FZFInterface:
             print(f"Error running FZF: {e}", file=sys.stderr)
             return None
 
-    def input_with_completion(
-        self, prompt: str, completion_items: list[str], allow_multiple: bool = True,
-    ) -> str:
-        """Get input with FZF-based autocompletion.
-
-        Args:
-            prompt: Prompt text to display
-            completion_items: List of items for autocompletion
-            allow_multiple: Whether to allow multiple comma-separated selections
-
-        Returns:
-            User input string
-        """
-        print(f"{prompt}", end="", flush=True)
-
-        if not completion_items:
-            # No completion items, just get regular input
-            return input()
-
-        try:
-            # For now, implement basic input with fallback
-            # In a full implementation, this could use a more sophisticated approach
-            # with FZF for tag completion, but for initial implementation we'll use
-            # simple input with a hint about available tags
-            if completion_items:
-                print(
-                    f" (available: {', '.join(completion_items[:5])}{'...' if len(completion_items) > 5 else ''})",
-                )
-                print(prompt, end="", flush=True)
-
-            return input()
-
-        except (KeyboardInterrupt, EOFError):
-            return ""
+        finally:
+            # Never leave FZF or the feeder running if finishing failed
+            if session is not None:
+                session.cancel()
 
     def select_tags(self, available_tags: list[str]) -> list[str]:
         """Select multiple tags using FZF.
@@ -153,20 +290,10 @@ class FZFInterface:
                 "--info=inline",
             ]
 
-            process = subprocess.Popen(
-                fzf_cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                encoding="utf-8",
-            )
-
-            # Send tags to FZF
-            input_data = "\n".join(available_tags)
-            stdout, stderr = process.communicate(input=input_data)
+            # Stream tags to FZF
+            returncode, stdout, _ = self._run_fzf(fzf_cmd, available_tags)
 
-            if process.returncode == 0:
+            if returncode == 0:
                 selected = [
                     tag.strip() for tag in stdout.strip().split("\n") if tag.strip()
                 ]
@@ -178,6 +305,16 @@ class FZFInterface:
             return []
 
 
+@cache
+def get_fzf_interface() -> FZFInterface:
+    """Return the process-wide FZF interface, creating it on first use.
+
+    Returns:
+        The shared FZFInterface instance
+    """
+    return FZFInterface()
+
+
 class TagInput:
     """Handles tag input with autocompletion and validation."""
 
@@ -1,10 +1,90 @@
 """Data models for the bookmark manager."""
 
-from dataclasses import dataclass
+import logging
+import mmap
+import os
+import sys
+import unicodedata
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+def _to_nfc(value: str) -> str:
+    """Return a string in Unicode normalization form NFC.
+
+    ASCII strings are always NFC, and is_normalized() runs the Unicode quick
+    check without allocating, so only strings that actually need composing
+    are rebuilt.
+
+    Args:
+        value: String to normalize
+
+    Returns:
+        The same string if already NFC, otherwise its NFC form
+    """
+    if value.isascii() or unicodedata.is_normalized("NFC", value):
+        return value
+    return unicodedata.normalize("NFC", value)
+
+
+def _normalize_name(name: str) -> str:
+    """Normalize the bookmark name to title case and validate format.
+
+    Args:
+        name: The raw name input
+
+    Returns:
+        The normalized name in title case
+
+    Raises:
+        ValueError: If name contains pipe characters
+    """
+    if "|" in name:
+        raise ValueError("Name cannot contain pipe characters")
+
+    name = _to_nfc(name)
+
+    # Names read back from a bookmark file are usually already in title
+    # case; detect that without allocating a new string. istitle() only
+    # agrees with title() for ASCII (it differs on digraphs like "Ǆ")
+    if name.isascii() and name.istitle():
+        return name
+    return name.title()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_tags(tags: str) -> str:
+    """Normalize tags to lowercase, sorted, comma-separated format.
+
+    Results are memoized: the same few tag strings recur across a bookmark
+    file, so most calls skip the split, lowercase and sort entirely. The
+    returned strings are interned, so bookmarks with equal tags share one
+    string object.
+
+    Args:
+        tags: The raw tags input (comma-separated)
+
+    Returns:
+        Normalized tags string (lowercase, sorted, deduplicated)
+    """
+    if not tags.strip():
+        return ""
+
+    tags = _to_nfc(tags)
+
+    # Split, strip whitespace, convert to lowercase and drop empty strings,
+    # deduplicating into a set since the result is sorted anyway
+    unique_tags = {tag for part in tags.split(",") if (tag := part.strip().lower())}
+
+    return sys.intern(",".join(sorted(unique_tags)))
+
+
+@dataclass(slots=True)
 class Bookmark:
     """A single bookmark entry.
 
@@ -19,101 +99,229 @@ class Bookmark:
 
     def __post_init__(self) -> None:
         """Validate and normalize bookmark fields after initialization."""
-        self.name = self._normalize_name(self.name)
-        self.tags = self._normalize_tags(self.tags)
+        self.name = _normalize_name(self.name)
+        self.description = _to_nfc(self.description)
+        self.tags = _normalize_tags(self.tags)
+
+    def to_line(self) -> str:
+        """Convert bookmark to pipe-delimited line format.
 
-    def _normalize_name(self, name: str) -> str:
-        """Normalize the bookmark name to title case and validate format.
+        Returns:
+            Bookmark as a pipe-delimited string
+        """
+        return f"{self.name}|{self.url}|{self.description}|{self.tags}"
+
+    @classmethod
+    def from_line(cls, line: str) -> "Bookmark":
+        """Create a Bookmark from a pipe-delimited line.
 
         Args:
-            name: The raw name input
+            line: A pipe-delimited bookmark line
 
         Returns:
-            The normalized name in title case
+            A Bookmark instance
 
         Raises:
-            ValueError: If name contains pipe characters
+            ValueError: If line format is invalid
         """
-        if "|" in name:
-            raise ValueError("Name cannot contain pipe characters")
-        return name.title()
+        name, url, description, tags = _parse_line_fields(line)
+        return _bookmark_from_fields(name, url, description, tags)
 
-    def _normalize_tags(self, tags: str) -> str:
-        """Normalize tags to lowercase, sorted, comma-separated format.
+    def matches_display_format(self, fields: Sequence[str]) -> str:
+        """Format bookmark for display according to specified fields.
 
         Args:
-            tags: The raw tags input (comma-separated)
+            fields: List of field names to display
 
         Returns:
-            Normalized tags string (lowercase, sorted, deduplicated)
+            Formatted string with requested fields separated by pipes
         """
-        if not tags.strip():
-            return ""
+        return _display_formatter(tuple(fields))(self)
 
-        # Split, strip whitespace, convert to lowercase, remove duplicates
-        tag_list = [tag.strip().lower() for tag in tags.split(",")]
-        tag_list = [tag for tag in tag_list if tag]  # Remove empty strings
-        unique_tags = list(
-            dict.fromkeys(tag_list),
-        )  # Preserve order while removing duplicates
-        unique_tags.sort()  # Sort alphabetically
 
-        return ",".join(unique_tags)
+def _bookmark_from_fields(
+    name: str, url: str, description: str, tags: str,
+) -> Bookmark:
+    """Build a Bookmark from fields split out of a bookmark file line.
 
-    def to_line(self) -> str:
-        """Convert bookmark to pipe-delimited line format.
+    Lines written by this tool are already normalized, so when the name and
+    tags are canonical the object is assembled directly, skipping __init__
+    and __post_init__. Hand-edited lines that are not canonical still go
+    through full normalization.
 
-        Returns:
-            Bookmark as a pipe-delimited string
-        """
-        return f"{self.name}|{self.url}|{self.description}|{self.tags}"
+    Args:
+        name: Name field, without pipe characters
+        url: URL field
+        description: Description field
+        tags: Tags field
+
+    Returns:
+        A Bookmark instance
+    """
+    canonical_tags = _normalize_tags(tags)
+    if name.isascii() and name.istitle() and canonical_tags == tags:
+        bookmark = object.__new__(Bookmark)
+        bookmark.name = name
+        bookmark.url = url
+        bookmark.description = _to_nfc(description)
+        # Store the shared normalized string rather than the parsed copy
+        bookmark.tags = canonical_tags
+        return bookmark
+    return Bookmark(name, url, description, tags)
+
+
+@lru_cache(maxsize=4096)
+def _parse_line_fields(line: str) -> tuple[str, str, str, str]:
+    """Split a pipe-delimited bookmark line into its four raw fields.
+
+    Successful parses are memoized, so the same line parsed again skips the
+    strip and split; malformed lines raise and are never cached. Bulk reads
+    in BookmarkManager split lines directly, since a single pass over a file
+    would only pay to fill the cache.
+
+    Args:
+        line: A pipe-delimited bookmark line
+
+    Returns:
+        The (name, url, description, tags) fields, unnormalized
+
+    Raises:
+        ValueError: If line format is invalid
+    """
+    # A fifth split is enough to tell a line has too many fields, so cap the
+    # split there; the exact count is only needed for the error
+    line = line.strip()
+    parts = line.split("|", 4)
+    if len(parts) != 4:
+        raise ValueError(
+            f"Invalid bookmark format: expected 4 fields, got {line.count('|') + 1}",
+        )
+
+    name, url, description, tags = parts
+    return name, url, description, tags
+
+
+# Bookmark files at least this large are memory-mapped when read
+_MMAP_THRESHOLD = 1024 * 1024
+
+# Bookmark attributes that may appear in display_fields
+_DISPLAY_FIELDS = frozenset({"name", "url", "description", "tags"})
+
+
+@lru_cache(maxsize=32)
+def _display_formatter(fields: tuple[str, ...]) -> Callable[[Bookmark], str]:
+    """Build a formatter specialized for one display field layout.
+
+    The result is cached per fields tuple, so formatting a whole list with the
+    same layout does the field lookups once rather than once per bookmark.
+
+    Args:
+        fields: Field names to display; unknown names render as empty strings
+
+    Returns:
+        Function formatting a bookmark as the requested pipe-separated fields
+    """
+    if not fields:
+        return lambda _bookmark: ""
+
+    if all(field in _DISPLAY_FIELDS for field in fields):
+        # A single attrgetter fetches every field in one C-level call
+        if len(fields) == 1:
+            return attrgetter(fields[0])
+        getter = attrgetter(*fields)
+        return lambda bookmark: "|".join(getter(bookmark))
+
+    # Unknown fields need a placeholder, so fetch each field separately
+    getters = [
+        attrgetter(field) if field in _DISPLAY_FIELDS else lambda _bookmark: ""
+        for field in fields
+    ]
+    return lambda bookmark: "|".join([get(bookmark) for get in getters])
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """User configuration loaded from config.yaml.
+
+    Every field has a default, so a missing or partial config file still
+    yields a complete configuration. Instances are immutable, which lets a
+    single parsed config be shared safely.
+    """
+
+    display_fields: tuple[str, ...] = ("name", "description", "url")
+    browser: str | tuple[str, ...] | None = None
+    default_bookmark_file: str = "bookmarks.txt"
+    max_fzf_results: int | None = 5000
 
     @classmethod
-    def from_line(cls, line: str) -> "Bookmark":
-        """Create a Bookmark from a pipe-delimited line.
+    def from_mapping(cls, data: object) -> "Config":
+        """Create a Config from parsed YAML, validating known fields.
+
+        Unknown keys are ignored; missing keys, and a null
+        default_bookmark_file, keep their defaults.
 
         Args:
-            line: A pipe-delimited bookmark line
+            data: The parsed YAML document (None for an empty file)
 
         Returns:
-            A Bookmark instance
+            A Config instance
 
         Raises:
-            ValueError: If line format is invalid
+            TypeError: If the document or any known field has the wrong type
+            ValueError: If max_fzf_results is negative
         """
-        parts = line.strip().split("|")
-        if len(parts) != 4:
-            raise ValueError(
-                f"Invalid bookmark format: expected 4 fields, got {len(parts)}",
+        if data is None:
+            return cls()
+        if not isinstance(data, dict):
+            raise TypeError("expected a mapping at the top level")
+
+        known = {field.name for field in fields(cls)}
+        values = {key: value for key, value in data.items() if key in known}
+
+        if "display_fields" in values:
+            values["display_fields"] = cls._string_tuple(
+                "display_fields", values["display_fields"],
             )
 
-        name, url, description, tags = parts
-        return cls(name=name, url=url, description=description, tags=tags)
+        browser = values.get("browser")
+        if browser is not None and not isinstance(browser, str):
+            values["browser"] = cls._string_tuple("browser", browser)
 
-    def matches_display_format(self, fields: list[str]) -> str:
-        """Format bookmark for display according to specified fields.
+        # A null file name keeps the default, like a missing key
+        default_file = values.get("default_bookmark_file", "")
+        if default_file is None:
+            del values["default_bookmark_file"]
+        elif not isinstance(default_file, str):
+            raise TypeError("default_bookmark_file must be a string")
+
+        max_results = values.get("max_fzf_results")
+        if max_results is not None and (
+            isinstance(max_results, bool) or not isinstance(max_results, int)
+        ):
+            raise TypeError("max_fzf_results must be an integer")
+        if max_results is not None and max_results < 0:
+            # 0 or null disable the cap; a negative count has no meaning
+            raise ValueError("max_fzf_results must not be negative")
+
+        return cls(**values)
+
+    @staticmethod
+    def _string_tuple(name: str, value: object) -> tuple[str, ...]:
+        """Validate a list of strings and convert it to a tuple.
 
         Args:
-            fields: List of field names to display
+            name: Field name used in the error message
+            value: The raw value from YAML
 
         Returns:
-            Formatted string with requested fields separated by pipes
-        """
-        field_map = {
-            "name": self.name,
-            "url": self.url,
-            "description": self.description,
-            "tags": self.tags,
-        }
-
-        display_values = []
-        for field in fields:
-            if field in field_map:
-                display_values.append(field_map[field])
-            else:
-                display_values.append("")
+            The strings as a tuple
 
-        return "|".join(display_values)
+        Raises:
+            TypeError: If value is not a list of strings
+        """
+        if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+            raise TypeError(f"{name} must be a list of strings")
+        return tuple(value)
 
 
 class BookmarkManager:
@@ -131,6 +339,10 @@ class BookmarkManager:
         """
         self.bookmark_file = bookmark_file
 
+        # Set once the bookmark file is known to exist, so repeated calls to
+        # ensure_file_exists() skip the stat
+        self._file_ensured = False
+
     def read_bookmarks(self) -> list[Bookmark]:
         """Read all bookmarks from the file.
 
@@ -141,26 +353,89 @@ class BookmarkManager:
             FileNotFoundError: If bookmark file doesn't exist
             PermissionError: If bookmark file can't be read
         """
+        return list(self.iter_bookmarks())
+
+    def iter_bookmarks(self) -> Iterator[Bookmark]:
+        """Yield bookmarks from the file one at a time.
+
+        Each Bookmark is built only when requested, so callers looking for a
+        single entry can stop early without constructing the rest.
+
+        Yields:
+            Bookmark objects in file order
+
+        Raises:
+            PermissionError: If bookmark file can't be read
+        """
+        for parts in self._iter_rows():
+            yield _bookmark_from_fields(*parts)
+
+    def read_bookmark_columns(
+        self,
+    ) -> tuple[list[str], list[str], list[str], list[str]]:
+        """Read all bookmarks as parallel field columns.
+
+        Fields are normalized exactly as read_bookmarks() would, but no Bookmark
+        objects are built, which suits bulk filtering over large files.
+
+        Returns:
+            Tuple of (names, urls, descriptions, tags) lists, index-aligned
+
+        Raises:
+            PermissionError: If bookmark file can't be read
+        """
+        rows = list(self._iter_rows())
+        if not rows:
+            return [], [], [], []
+
+        names, urls, descriptions, tags = zip(*rows, strict=True)
+        return (
+            [_normalize_name(name) for name in names],
+            list(urls),
+            [_to_nfc(description) for description in descriptions],
+            [_normalize_tags(tag) for tag in tags],
+        )
+
+    def _read_text(self) -> str:
+        """Read the whole bookmark file as text with universal newlines.
+
+        Large files are memory-mapped and decoded straight from the mapping,
+        skipping the intermediate bytes copy a plain read() would make.
+
+        Returns:
+            The decoded file contents
+        """
+        with open(self.bookmark_file, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _MMAP_THRESHOLD:
+                # Read the whole file in one call rather than iterating lines
+                text = f.read().decode("utf-8")
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    text = str(mm, "utf-8")
+
+        # Translate CRLF and lone CR endings as text-mode reads would
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    def _iter_rows(self) -> Iterator[list[str]]:
+        """Read the bookmark file and split each valid line into its four fields.
+
+        Malformed lines are skipped, each logged as a warning with its line
+        number.
+
+        Yields:
+            Raw (unnormalized) field lists, one per well-formed line
+
+        Raises:
+            PermissionError: If bookmark file can't be read
+        """
         if not self.bookmark_file.exists():
-            return []
+            return
 
-        bookmarks = []
         try:
-            with open(self.bookmark_file, encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:  # Skip blank lines
-                        continue
-
-                    try:
-                        bookmark = Bookmark.from_line(line)
-                        bookmarks.append(bookmark)
-                    except ValueError as e:
-                        # Handle malformed entries gracefully - log and skip
-                        print(
-                            f"Warning: Skipping malformed bookmark on line {line_num}: {e}",
-                        )
-                        continue
+            text = self._read_text()
         except PermissionError as e:
             raise PermissionError(
                 f"Cannot read bookmark file {self.bookmark_file}: {e}",
@@ -170,7 +445,32 @@ class BookmarkManager:
                 f"Error reading bookmark file {self.bookmark_file}: {e}",
             ) from e
 
-        return bookmarks
+        for line_num, line in enumerate(text.split("\n"), 1):
+            if not line:  # Skip blank lines
+                continue
+
+            # Only pay for strip() on lines that carry surrounding whitespace,
+            # such as "\r" from CRLF files or whitespace-only lines
+            if line[0].isspace() or line[-1].isspace():
+                line = line.strip()
+                if not line:
+                    continue
+
+            # A well-formed line splits into exactly four fields; stop at a
+            # fifth, since any more only matter for the warning
+            parts = line.split("|", 4)
+            if len(parts) == 4:
+                yield parts
+                continue
+
+            # Handle malformed entries gracefully - log and skip; the message
+            # is only formatted if the record is emitted
+            logger.warning(
+                "Skipping malformed bookmark on line %d: "
+                "Invalid bookmark format: expected 4 fields, got %d",
+                line_num,
+                line.count("|") + 1,
+            )
 
     def add_bookmark(self, bookmark: Bookmark) -> None:
         """Add a bookmark to the file.
@@ -181,12 +481,30 @@ class BookmarkManager:
         Raises:
             PermissionError: If bookmark file can't be written
         """
-        # Ensure parent directory exists
-        self.bookmark_file.parent.mkdir(parents=True, exist_ok=True)
+        self.add_bookmarks([bookmark])
+
+    def add_bookmarks(self, bookmarks: Iterable[Bookmark]) -> None:
+        """Append several bookmarks to the file with a single open and write.
+
+        Args:
+            bookmarks: The bookmarks to add, in order
+
+        Raises:
+            PermissionError: If bookmark file can't be written
+        """
+        # Build and encode the whole payload first so the file sees one write
+        lines = [bookmark.to_line() for bookmark in bookmarks]
+        if not lines:
+            return
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+
+        # Ensure parent directory exists, unless the file is already known to
+        if not self._file_ensured:
+            self.bookmark_file.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            with open(self.bookmark_file, "a", encoding="utf-8") as f:
-                f.write(bookmark.to_line() + "\n")
+            self._append_raw(data)
+            self._file_ensured = True
         except PermissionError as e:
             raise PermissionError(
                 f"Cannot write to bookmark file {self.bookmark_file}: {e}",
@@ -196,12 +514,36 @@ class BookmarkManager:
                 f"Error writing to bookmark file {self.bookmark_file}: {e}",
             ) from e
 
+    def _append_raw(self, data: bytes) -> None:
+        """Append encoded bytes to the bookmark file, creating it if needed.
+
+        Goes through a raw O_APPEND descriptor: a one-shot write gains nothing
+        from the text and buffer layers open() would stack on top.
+
+        Args:
+            data: Encoded payload to append
+
+        Raises:
+            OSError: If the file can't be opened or written
+        """
+        fd = os.open(self.bookmark_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+        try:
+            # Retry short writes until the whole payload is written
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+
     def ensure_file_exists(self) -> None:
         """Ensure the bookmark file exists, creating it if necessary.
 
         Raises:
             PermissionError: If file can't be created
         """
+        if self._file_ensured:
+            return
+
         if not self.bookmark_file.exists():
             # Ensure parent directory exists
             self.bookmark_file.parent.mkdir(parents=True, exist_ok=True)
@@ -216,3 +558,5 @@ class BookmarkManager:
                 raise OSError(
                     f"Error creating bookmark file {self.bookmark_file}: {e}",
                 ) from e
+
+        self._file_ensured = True
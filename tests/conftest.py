@@ -1,29 +1,45 @@
 """Pytest configuration and fixtures for bookmark manager tests."""
 
+import os
 import pytest
 import tempfile
 import shutil
 from pathlib import Path
 
 
+def _worker_temp_dir():
+    """Return this test process's directory under tests/temp.
+
+    Each pytest-xdist worker gets its own subdirectory, so one worker's
+    end-of-session sweep never removes directories another is still using.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    project_root = Path(__file__).parent.parent
+    return project_root / "tests" / "temp" / worker
+
+
+@pytest.fixture(scope="session")
+def test_temp_root():
+    """Create this process's tests/temp directory once for the whole session."""
+    test_temp_dir = _worker_temp_dir()
+    test_temp_dir.mkdir(parents=True, exist_ok=True)
+    return test_temp_dir
+
+
 @pytest.fixture
-def temp_project_dir():
+def temp_project_dir(test_temp_root):
     """Create a temporary directory within the project for testing.
 
     This fixture ensures all test operations stay within project boundaries
     as required by CLAUDE.md ABSOLUTE IMPERATIVES.
     """
-    # Create temp directory within the project's test directory
-    project_root = Path(__file__).parent.parent
-    test_temp_dir = project_root / "tests" / "temp"
-    test_temp_dir.mkdir(exist_ok=True)
-
-    # Create unique temp directory for this test session
-    temp_dir = Path(tempfile.mkdtemp(dir=test_temp_dir))
+    # Create unique temp directory for this test
+    temp_dir = Path(tempfile.mkdtemp(dir=test_temp_root))
 
     yield temp_dir
 
-    # Clean up after test
+    # Clean up after test; this directory must stay inside tests/temp rather
+    # than under tmp_path, so pytest's retention policy never removes it
     if temp_dir.exists():
         shutil.rmtree(temp_dir)
 
@@ -41,14 +57,17 @@ def mock_home_dir(temp_project_dir):
     return mock_home
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def cleanup_test_artifacts():
-    """Automatically clean up any test artifacts after each test."""
+    """Clean up any test artifacts once, after the whole session.
+
+    Per-test directories are removed by their own fixtures, so only leftovers
+    from interrupted tests remain; one sweep at the end is enough.
+    """
     yield
 
-    # Clean up any temporary test directories in the tests folder
-    project_root = Path(__file__).parent.parent
-    test_temp_dir = project_root / "tests" / "temp"
+    # Clean up any temporary test directories this process left behind
+    test_temp_dir = _worker_temp_dir()
 
     if test_temp_dir.exists():
         # Remove any leftover temporary directories
@@ -1,23 +1,24 @@
 """Tests for file management utilities."""
 
+import os
 import pytest
-import tempfile
 import shutil
+from dataclasses import FrozenInstanceError
 from pathlib import Path
+from unittest.mock import patch
 import yaml
 
 from bookmark.file_manager import BookmarkFileManager, ProjectTestFileManager
+from bookmark.models import Config
 
 
 class TestBookmarkFileManager:
     """Test the BookmarkFileManager class."""
 
     @pytest.fixture
-    def temp_base_dir(self):
+    def temp_base_dir(self, tmp_path):
         """Create a temporary base directory for testing."""
-        temp_dir = Path(tempfile.mkdtemp())
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+        return tmp_path
 
     @pytest.fixture
     def file_manager(self, temp_base_dir):
@@ -50,7 +51,7 @@ class TestBookmarkFileManager:
 
         assert not file_manager.base_dir.exists()
         file_manager.ensure_base_directory()
-        assert file_manager.base_dir.exists()
+        # is_dir() is False for missing paths, so one stat() covers both checks
         assert file_manager.base_dir.is_dir()
 
     def test_ensure_base_directory_exists(self, file_manager):
@@ -62,6 +63,15 @@ class TestBookmarkFileManager:
         file_manager.ensure_base_directory()
         assert file_manager.base_dir.exists()
 
+    def test_ensure_base_directory_checks_once(self, file_manager):
+        """Test ensure_base_directory skips the filesystem after the first call."""
+        file_manager.ensure_base_directory()
+        shutil.rmtree(file_manager.base_dir)
+
+        # The directory is assumed to still exist for this manager's lifetime
+        file_manager.ensure_base_directory()
+        assert not file_manager.base_dir.exists()
+
     def test_get_bookmark_file_path_default(self, file_manager):
         """Test getting bookmark file path with default name."""
         path = file_manager.get_bookmark_file_path()
@@ -97,7 +107,7 @@ class TestBookmarkFileManager:
         """Test reading tags from valid file."""
         file_manager.ensure_base_directory()
 
-        with open(file_manager.tags_file, "w") as f:
+        with open(file_manager.tags_file, "w", encoding="utf-8", newline="") as f:
             f.write("web\n")
             f.write("testing\n")
             f.write("code\n")
@@ -110,7 +120,7 @@ class TestBookmarkFileManager:
         """Test reading tags handles duplicates and case normalization."""
         file_manager.ensure_base_directory()
 
-        with open(file_manager.tags_file, "w") as f:
+        with open(file_manager.tags_file, "w", encoding="utf-8", newline="") as f:
             f.write("WEB\n")
             f.write("testing\n")
             f.write("Web\n")  # Duplicate in different case
@@ -124,7 +134,7 @@ class TestBookmarkFileManager:
         """Test reading tags ignores blank lines."""
         file_manager.ensure_base_directory()
 
-        with open(file_manager.tags_file, "w") as f:
+        with open(file_manager.tags_file, "w", encoding="utf-8", newline="") as f:
             f.write("web\n")
             f.write("\n")  # Blank line
             f.write("testing\n")
@@ -134,6 +144,13 @@ class TestBookmarkFileManager:
         tags = file_manager.read_tags()
         assert tags == ["code", "testing", "web"]
 
+    def test_read_tags_crlf_line_endings(self, file_manager):
+        """Test reading tags from a file with CRLF line endings."""
+        file_manager.ensure_base_directory()
+        file_manager.tags_file.write_bytes(b"web\r\ncode\r\n")
+
+        assert file_manager.read_tags() == ["code", "web"]
+
     def test_update_tags_new_tags(self, file_manager):
         """Test updating tags with new tags."""
         new_tags = ["python", "web", "testing"]
@@ -148,7 +165,7 @@ class TestBookmarkFileManager:
         """Test updating tags merges with existing tags."""
         # Create initial tags
         file_manager.ensure_base_directory()
-        with open(file_manager.tags_file, "w") as f:
+        with open(file_manager.tags_file, "w", encoding="utf-8", newline="") as f:
             f.write("existing\n")
             f.write("web\n")
 
@@ -174,16 +191,46 @@ class TestBookmarkFileManager:
         tags = file_manager.read_tags()
         assert tags == ["python", "testing", "web"]
 
+    def test_update_tags_known_tags_skips_write(self, file_manager):
+        """Test updating with only already-known tags leaves the file untouched."""
+        file_manager.ensure_base_directory()
+        with open(file_manager.tags_file, "w", encoding="utf-8", newline="") as f:
+            f.write("web\n")
+            f.write("python\n")  # Deliberately unsorted
+
+        file_manager.update_tags(["WEB", " python "])
+
+        # File was not rewritten, so the original order is preserved
+        assert file_manager.tags_file.read_text() == "web\npython\n"
+
+    def test_read_tags_reuses_loaded_tags(self, file_manager):
+        """Test that completion reads tags from disk once per manager."""
+        file_manager.update_tags(["python"])
+
+        with patch.object(
+            file_manager, "_read_tag_set", side_effect=AssertionError("re-read"),
+        ):
+            assert file_manager.read_tags() == ["python"]
+
+    def test_update_tags_keeps_tags_from_other_managers(self, temp_base_dir):
+        """Test tags written by another manager since read_tags() are kept."""
+        first = BookmarkFileManager(custom_base_dir=temp_base_dir)
+        second = BookmarkFileManager(custom_base_dir=temp_base_dir)
+        first.update_tags(["seed"])
+
+        # First manager loads tags for completion, then another create finishes
+        assert first.read_tags() == ["seed"]
+        second.update_tags(["fromb"])
+        first.update_tags(["froma"])
+
+        assert first.tags_file.read_text() == "froma\nfromb\nseed\n"
+        assert first.read_tags() == ["froma", "fromb", "seed"]
+
     def test_read_config_default(self, file_manager):
         """Test reading config returns defaults when file doesn't exist."""
         config = file_manager.read_config()
 
-        expected = {
-            "display_fields": ["name", "description", "url"],
-            "browser": None,
-            "default_bookmark_file": "bookmarks.txt",
-        }
-        assert config == expected
+        assert config == Config()
 
     def test_read_config_valid_file(self, file_manager):
         """Test reading valid config file."""
@@ -195,13 +242,13 @@ class TestBookmarkFileManager:
             "default_bookmark_file": "my_bookmarks.txt",
         }
 
-        with open(file_manager.config_file, "w") as f:
+        with open(file_manager.config_file, "w", encoding="utf-8", newline="") as f:
             yaml.dump(config_data, f)
 
         config = file_manager.read_config()
-        assert config["display_fields"] == ["name", "url"]
-        assert config["browser"] == "firefox"
-        assert config["default_bookmark_file"] == "my_bookmarks.txt"
+        assert config.display_fields == ("name", "url")
+        assert config.browser == "firefox"
+        assert config.default_bookmark_file == "my_bookmarks.txt"
 
     def test_read_config_partial_override(self, file_manager):
         """Test reading config file with partial overrides."""
@@ -212,13 +259,13 @@ class TestBookmarkFileManager:
             # Only override browser, keep other defaults
         }
 
-        with open(file_manager.config_file, "w") as f:
+        with open(file_manager.config_file, "w", encoding="utf-8", newline="") as f:
             yaml.dump(config_data, f)
 
         config = file_manager.read_config()
-        assert config["display_fields"] == ["name", "description", "url"]  # Default
-        assert config["browser"] == "chrome"  # Overridden
-        assert config["default_bookmark_file"] == "bookmarks.txt"  # Default
+        assert config.display_fields == ("name", "description", "url")  # Default
+        assert config.browser == "chrome"  # Overridden
+        assert config.default_bookmark_file == "bookmarks.txt"  # Default
 
     def test_read_config_empty_file(self, file_manager):
         """Test reading empty config file returns defaults."""
@@ -226,38 +273,161 @@ class TestBookmarkFileManager:
         file_manager.config_file.touch()  # Create empty file
 
         config = file_manager.read_config()
-        expected = {
-            "display_fields": ["name", "description", "url"],
-            "browser": None,
-            "default_bookmark_file": "bookmarks.txt",
-        }
-        assert config == expected
+        assert config == Config()
 
     def test_read_config_invalid_yaml(self, file_manager):
         """Test reading config file with invalid YAML returns defaults."""
         file_manager.ensure_base_directory()
 
-        with open(file_manager.config_file, "w") as f:
+        with open(file_manager.config_file, "w", encoding="utf-8", newline="") as f:
             f.write("invalid: yaml: content:\n  - malformed\n    - list")
 
         config = file_manager.read_config()
-        expected = {
-            "display_fields": ["name", "description", "url"],
-            "browser": None,
-            "default_bookmark_file": "bookmarks.txt",
-        }
-        assert config == expected
+        assert config == Config()
+
+    def test_read_config_is_cached(self, file_manager):
+        """Test config is parsed once and reused until invalidated."""
+        file_manager.ensure_base_directory()
+
+        with open(file_manager.config_file, "w", encoding="utf-8", newline="") as f:
+            yaml.dump({"browser": "firefox"}, f)
+
+        assert file_manager.read_config().browser == "firefox"
+
+        # Changes on disk are not seen while the cache is warm
+        with open(file_manager.config_file, "w", encoding="utf-8", newline="") as f:
+            yaml.dump({"browser": "chrome"}, f)
+
+        assert file_manager.read_config().browser == "firefox"
+
+        # Invalidating forces a fresh parse
+        file_manager.invalidate_config()
+        assert file_manager.read_config().browser == "chrome"
+
+    def test_read_config_reuses_parse_for_unchanged_file(self, temp_base_dir):
+        """Test a fresh manager skips YAML parsing when the file is unchanged."""
+        first = BookmarkFileManager(custom_base_dir=temp_base_dir)
+        first.ensure_base_directory()
+        with open(first.config_file, "w", encoding="utf-8", newline="") as f:
+            yaml.dump({"browser": "firefox"}, f)
+
+        assert first.read_config().browser == "firefox"
+
+        second = BookmarkFileManager(custom_base_dir=temp_base_dir)
+        with patch("bookmark.file_manager.yaml.load") as mock_load:
+            assert second.read_config().browser == "firefox"
+        mock_load.assert_not_called()
+
+    def test_invalidate_config_rereads_same_stamp_edit(self, file_manager):
+        """Test invalidation re-parses an edit that keeps size and mtime."""
+        file_manager.ensure_base_directory()
+        with open(file_manager.config_file, "w", encoding="utf-8", newline="") as f:
+            yaml.dump({"browser": "firefox"}, f)
+
+        assert file_manager.read_config().browser == "firefox"
+
+        # Rewrite with a same-length value and restore the original mtime
+        stat = os.stat(file_manager.config_file)
+        with open(file_manager.config_file, "w", encoding="utf-8", newline="") as f:
+            yaml.dump({"browser": "chromey"}, f)
+        os.utime(file_manager.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert os.stat(file_manager.config_file).st_size == stat.st_size
+
+        file_manager.invalidate_config()
+        assert file_manager.read_config().browser == "chromey"
+
+    def test_read_config_cache_is_bounded(self, temp_base_dir):
+        """Test the shared config cache evicts its least recently used entry."""
+        first = BookmarkFileManager(custom_base_dir=temp_base_dir / "first")
+        second = BookmarkFileManager(custom_base_dir=temp_base_dir / "second")
+        for manager in (first, second):
+            manager.ensure_base_directory()
+            with open(manager.config_file, "w", encoding="utf-8", newline="") as f:
+                yaml.dump({"browser": "firefox"}, f)
+
+        with (
+            patch.dict("bookmark.file_manager._CONFIG_CACHE", clear=True) as cache,
+            patch("bookmark.file_manager._CONFIG_CACHE_SIZE", 1),
+        ):
+            first.read_config()
+            second.read_config()
+            assert list(cache) == [second.config_file]
+
+    def test_read_config_is_immutable(self, file_manager):
+        """Test a returned config cannot be mutated under the cache."""
+        config = file_manager.read_config()
+        with pytest.raises(FrozenInstanceError):
+            config.browser = "mutated"
+
+        assert file_manager.read_config().browser is None
+
+    def test_read_config_browser_list(self, file_manager):
+        """Test a browser given as a list is kept as an argument tuple."""
+        file_manager.ensure_base_directory()
+
+        with open(file_manager.config_file, "w", encoding="utf-8", newline="") as f:
+            yaml.dump({"browser": ["firefox", "--new-tab"]}, f)
+
+        assert file_manager.read_config().browser == ("firefox", "--new-tab")
+
+    def test_read_config_invalid_field_type(self, file_manager):
+        """Test a config with a wrongly typed field falls back to defaults."""
+        file_manager.ensure_base_directory()
+
+        with open(file_manager.config_file, "w", encoding="utf-8", newline="") as f:
+            yaml.dump({"display_fields": "name", "browser": "firefox"}, f)
+
+        assert file_manager.read_config() == Config()
+
+    def test_read_config_null_default_bookmark_file(self, file_manager):
+        """Test a null default_bookmark_file keeps the default and other keys."""
+        file_manager.ensure_base_directory()
+        with open(file_manager.config_file, "w", encoding="utf-8", newline="") as f:
+            yaml.dump({"default_bookmark_file": None, "browser": "firefox"}, f)
+
+        config = file_manager.read_config()
+        assert config == Config(browser="firefox")
+        assert config.default_bookmark_file == "bookmarks.txt"
+
+    def test_config_wrong_types_raise_type_error(self):
+        """Test wrongly typed config values raise TypeError."""
+        with pytest.raises(TypeError, match="mapping"):
+            Config.from_mapping(["browser"])
+        with pytest.raises(TypeError, match="default_bookmark_file"):
+            Config.from_mapping({"default_bookmark_file": 3})
+        with pytest.raises(TypeError, match="max_fzf_results"):
+            Config.from_mapping({"max_fzf_results": "many"})
+
+    def test_read_config_negative_max_fzf_results(self, file_manager):
+        """Test a negative result cap is rejected while 0 and null disable it."""
+        with pytest.raises(ValueError, match="must not be negative"):
+            Config.from_mapping({"max_fzf_results": -1})
+        assert Config.from_mapping({"max_fzf_results": 0}).max_fzf_results == 0
+        assert Config.from_mapping({"max_fzf_results": None}).max_fzf_results is None
+
+        file_manager.ensure_base_directory()
+        with open(file_manager.config_file, "w", encoding="utf-8", newline="") as f:
+            yaml.dump({"max_fzf_results": -5, "browser": "firefox"}, f)
+
+        assert file_manager.read_config() == Config()
+
+    def test_read_config_ignores_unknown_keys(self, file_manager):
+        """Test unknown config keys are ignored rather than rejected."""
+        file_manager.ensure_base_directory()
+
+        with open(file_manager.config_file, "w", encoding="utf-8", newline="") as f:
+            yaml.dump({"browser": "firefox", "theme": "dark"}, f)
+
+        assert file_manager.read_config() == Config(browser="firefox")
 
 
 class TestProjectTestFileManager:
     """Test the ProjectTestFileManager class."""
 
     @pytest.fixture
-    def temp_test_dir(self):
+    def temp_test_dir(self, tmp_path):
         """Create a temporary test directory."""
-        temp_dir = Path(tempfile.mkdtemp())
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+        return tmp_path
 
     def test_project_test_file_manager_initialization(self, temp_test_dir):
         """Test that ProjectTestFileManager uses the provided test directory."""
@@ -282,4 +452,4 @@ class TestProjectTestFileManager:
 
         # Test config functionality
         config = manager.read_config()
-        assert "display_fields" in config
+        assert config.display_fields
@@ -0,0 +1,115 @@
+"""Tests for the FZF session and interface using a stub fzf executable."""
+
+import os
+import stat
+
+import pytest
+
+from bookmark.fzf_interface import FZFInterface
+
+
+class TestFZFInterface:
+    """Test FZF selection against a stub `fzf` script on PATH."""
+
+    @pytest.fixture
+    def stub_dir(self, tmp_path, monkeypatch):
+        """Put a directory for the stub fzf script at the front of PATH."""
+        monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+        return tmp_path
+
+    @pytest.fixture
+    def install_fzf(self, stub_dir):
+        """Return a helper that installs a stub fzf with the given shell body."""
+
+        def install(body: str) -> None:
+            script = stub_dir / "fzf"
+            script.write_text(f"#!/bin/sh\n{body}\n")
+            script.chmod(script.stat().st_mode | stat.S_IXUSR)
+
+        return install
+
+    @pytest.fixture
+    def fzf(self, monkeypatch):
+        """Create an FZF interface without probing for the real binary."""
+        monkeypatch.setattr(FZFInterface, "_fzf_checked", True)
+        return FZFInterface()
+
+    def _assert_exited(self, pid_file):
+        """Assert the stub fzf process that wrote pid_file is gone."""
+        pid = int(pid_file.read_text())
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+    def test_select_bookmark_returns_selection(self, install_fzf, fzf):
+        """Test that the line FZF prints is returned as the selection."""
+        # Select the second line of the input
+        install_fzf("sed -n 2p")
+
+        lines = ["first|https://one.test", "second|https://two.test"]
+        assert fzf.select_bookmark(lines) == "second|https://two.test"
+
+    def test_select_bookmark_empty_input_does_not_spawn(
+        self, stub_dir, install_fzf, fzf, capsys
+    ):
+        """Test that empty input never launches FZF."""
+        marker = stub_dir / "spawned"
+        install_fzf(f"touch '{marker}'")
+
+        assert fzf.select_bookmark([]) is None
+        assert not marker.exists()
+        assert "No bookmarks available." in capsys.readouterr().out
+
+    def test_select_bookmark_empty_input_cancels_session(self, install_fzf, fzf):
+        """Test that a pre-started session is stopped when there is no input."""
+        install_fzf("exec sleep 30")
+
+        session = fzf.begin_select_bookmark()
+        assert fzf.select_bookmark([], session=session) is None
+        assert session.process.poll() is not None
+
+    def test_select_bookmark_fzf_exits_before_reading(self, install_fzf, fzf):
+        """Test that FZF exiting early does not break the feeder (BrokenPipe)."""
+        # Answer immediately without reading stdin
+        install_fzf("echo picked")
+
+        # Far more input than a pipe buffer holds
+        lines = (f"site {i}|https://{i}.test" for i in range(200_000))
+        assert fzf.select_bookmark(lines) == "picked"
+
+    def test_select_bookmark_while_waiting_error_stops_fzf(
+        self, stub_dir, install_fzf, fzf, capsys
+    ):
+        """Test that a failing while_waiting callable leaves no FZF running."""
+        pid_file = stub_dir / "pid"
+        install_fzf(f"echo $$ > '{pid_file}'\nexec sleep 30")
+
+        def fail():
+            # Wait for the stub to record its PID before failing
+            while not pid_file.exists() or not pid_file.read_text():
+                pass
+            raise RuntimeError("warm-up failed")
+
+        assert fzf.select_bookmark(["a|https://a.test"], while_waiting=fail) is None
+        assert "Error running FZF: warm-up failed" in capsys.readouterr().err
+        self._assert_exited(pid_file)
+
+    def test_run_fzf_while_waiting_error_stops_fzf(self, stub_dir, install_fzf, fzf):
+        """Test that _run_fzf stops FZF before propagating a callable's error."""
+        pid_file = stub_dir / "pid"
+        install_fzf(f"echo $$ > '{pid_file}'\nexec sleep 30")
+
+        def fail():
+            # Wait for the stub to record its PID before failing
+            while not pid_file.exists() or not pid_file.read_text():
+                pass
+            raise RuntimeError("warm-up failed")
+
+        with pytest.raises(RuntimeError, match="warm-up failed"):
+            fzf._run_fzf(["fzf"], ["a", "b"], while_waiting=fail)
+        self._assert_exited(pid_file)
+
+    def test_select_tags_returns_selected_tags(self, install_fzf, fzf):
+        """Test multi-select output is split into individual tags."""
+        install_fzf("cat")
+
+        assert fzf.select_tags(["python", "web"]) == ["python", "web"]
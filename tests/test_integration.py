@@ -1,27 +1,25 @@
 """Integration tests for the bookmark manager."""
 
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 import yaml
 
 from bookmark.file_manager import ProjectTestFileManager
 from bookmark.bookmark_creator import BookmarkCreator
 from bookmark.bookmark_launcher import BookmarkLauncher
-from bookmark.models import BookmarkManager
+from bookmark.models import Bookmark, BookmarkManager
+
+# Emit test configs with the libyaml-backed dumper when PyYAML has it
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
 class TestBookmarkIntegration:
     """Integration tests for bookmark creation and launching workflows."""
 
     @pytest.fixture
-    def temp_test_dir(self):
-        """Create a temporary test directory within project bounds."""
-        temp_dir = Path(tempfile.mkdtemp())
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+    def temp_test_dir(self, tmp_path):
+        """Create a temporary test directory."""
+        return tmp_path
 
     @pytest.fixture
     def file_manager(self, temp_test_dir):
@@ -33,18 +31,18 @@ class TestBookmarkIntegration:
         """Create a test bookmark file path."""
         return temp_test_dir / "test_bookmarks.txt"
 
-    def test_complete_bookmark_lifecycle(self, file_manager, bookmark_file):
-        """Test complete bookmark creation and retrieval lifecycle."""
-        # Create a bookmark manager
-        bookmark_manager = BookmarkManager(bookmark_file)
+    @pytest.fixture
+    def bookmark_manager(self, bookmark_file):
+        """Create a bookmark manager for the test bookmark file."""
+        return BookmarkManager(bookmark_file)
 
+    def test_complete_bookmark_lifecycle(self, file_manager, bookmark_manager):
+        """Test complete bookmark creation and retrieval lifecycle."""
         # Ensure base directory exists
         file_manager.ensure_base_directory()
         bookmark_manager.ensure_file_exists()
 
         # Create test bookmarks
-        from bookmark.models import Bookmark
-
         bookmark1 = Bookmark(
             name="test site one",
             url="https://test1.com",
@@ -59,9 +57,8 @@ class TestBookmarkIntegration:
             tags="demo,web",
         )
 
-        # Add bookmarks
-        bookmark_manager.add_bookmark(bookmark1)
-        bookmark_manager.add_bookmark(bookmark2)
+        # Add bookmarks in one batched append
+        bookmark_manager.add_bookmarks([bookmark1, bookmark2])
 
         # Read back bookmarks
         bookmarks = bookmark_manager.read_bookmarks()
@@ -104,8 +101,6 @@ class TestBookmarkIntegration:
         personal_manager = BookmarkManager(personal_file)
 
         # Create work bookmark
-        from bookmark.models import Bookmark
-
         work_bookmark = Bookmark(
             "work site", "https://work.com", "Work stuff", "work,productivity"
         )
@@ -130,8 +125,8 @@ class TestBookmarkIntegration:
         """Test configuration file functionality."""
         # Default config
         config = file_manager.read_config()
-        assert config["display_fields"] == ["name", "description", "url"]
-        assert config["browser"] is None
+        assert config.display_fields == ("name", "description", "url")
+        assert config.browser is None
 
         # Create custom config
         file_manager.ensure_base_directory()
@@ -141,20 +136,190 @@ class TestBookmarkIntegration:
             "default_bookmark_file": "custom.txt",
         }
 
-        with open(file_manager.config_file, "w") as f:
-            yaml.dump(custom_config, f)
+        with open(file_manager.config_file, "w", encoding="utf-8", newline="") as f:
+            yaml.dump(custom_config, f, Dumper=_YAML_DUMPER)
+
+        # Drop the cached defaults so the new file is picked up
+        file_manager.invalidate_config()
 
         # Verify custom config is loaded
         config = file_manager.read_config()
-        assert config["display_fields"] == ["name", "url"]
-        assert config["browser"] == "firefox"
-        assert config["default_bookmark_file"] == "custom.txt"
+        assert config.display_fields == ("name", "url")
+        assert config.browser == "firefox"
+        assert config.default_bookmark_file == "custom.txt"
+
+    @patch("bookmark.bookmark_launcher.get_fzf_interface")
+    def test_launcher_resolves_bookmark_file_lazily(self, mock_get_fzf, file_manager):
+        """Test the default bookmark file is only resolved from config on use."""
+        file_manager.ensure_base_directory()
+        with open(file_manager.config_file, "w", encoding="utf-8", newline="") as f:
+            yaml.dump(
+                {"default_bookmark_file": "custom.txt"}, f, Dumper=_YAML_DUMPER,
+            )
+
+        with patch.object(
+            file_manager, "read_config", wraps=file_manager.read_config
+        ) as mock_read_config:
+            launcher = BookmarkLauncher(file_manager)
+            mock_read_config.assert_not_called()
+
+            assert launcher.bookmark_file == file_manager.base_dir / "custom.txt"
+            assert launcher.bookmark_manager.bookmark_file == launcher.bookmark_file
+            mock_read_config.assert_called_once()
+
+    @patch("bookmark.bookmark_launcher.get_fzf_interface")
+    def test_launcher_caps_fzf_results(
+        self, mock_get_fzf, file_manager, bookmark_file
+    ):
+        """Test the launcher only offers max_fzf_results bookmarks to FZF."""
+        file_manager.ensure_base_directory()
+        with open(file_manager.config_file, "w", encoding="utf-8", newline="") as f:
+            yaml.dump(
+                {"display_fields": ["name"], "max_fzf_results": 2},
+                f,
+                Dumper=_YAML_DUMPER,
+            )
+
+        bookmark_manager = BookmarkManager(bookmark_file)
+        bookmark_manager.add_bookmarks(
+            Bookmark(name, f"https://{name}.com")
+            for name in ["first", "second", "third"]
+        )
+
+        # Capture the lines FZF would receive, then cancel the selection
+        offered_lines = []
+        mock_fzf = mock_get_fzf.return_value
+        mock_fzf.select_bookmark.side_effect = (
+            lambda lines, **kwargs: offered_lines.extend(lines)
+        )
+
+        launcher = BookmarkLauncher(file_manager, bookmark_file)
+        assert launcher.launch_bookmark() is False
+        assert offered_lines == ["First", "Second"]
+
+    @patch("bookmark.bookmark_launcher.get_fzf_interface")
+    def test_launcher_reports_problems_before_fzf_opens(
+        self, mock_get_fzf, file_manager, bookmark_file, capsys, caplog
+    ):
+        """Test config and malformed-line warnings never overlap the FZF UI."""
+        file_manager.ensure_base_directory()
+        with open(file_manager.config_file, "w", encoding="utf-8", newline="") as f:
+            f.write("invalid: yaml: content:\n  - malformed\n    - list")
+        with open(bookmark_file, "w", encoding="utf-8", newline="") as f:
+            f.write("Site|https://site.com||\n")
+            f.write("Malformed line without pipes\n")
+
+        # Snapshot diagnostics when FZF opens, through either entry point, and
+        # again when it closes
+        snapshots = []
+
+        def snapshot():
+            snapshots.append((capsys.readouterr().err, len(caplog.records)))
+
+        def begin_select_bookmark(*args, **kwargs):
+            snapshot()
+            return MagicMock()
+
+        def select_bookmark(lines, while_waiting=None, session=None, **kwargs):
+            if session is None:
+                snapshot()
+            list(lines)
+            while_waiting()
+            snapshot()
+
+        mock_fzf = mock_get_fzf.return_value
+        mock_fzf.begin_select_bookmark.side_effect = begin_select_bookmark
+        mock_fzf.select_bookmark.side_effect = select_bookmark
+
+        launcher = BookmarkLauncher(file_manager, bookmark_file)
+        assert launcher.launch_bookmark() is False
+
+        # Both problems were reported before FZF started, none while it ran
+        [(stderr, record_count), during_fzf] = snapshots
+        assert "Invalid YAML in config file" in stderr
+        assert record_count == 1
+        assert "line 2" in caplog.records[0].getMessage()
+        assert during_fzf == ("", record_count)
+
+    @patch("bookmark.bookmark_launcher.get_fzf_interface")
+    def test_list_bookmarks_output(
+        self, mock_get_fzf, file_manager, bookmark_file, capsys
+    ):
+        """Test listing prints a header, separator and one line per bookmark."""
+        bookmark_manager = BookmarkManager(bookmark_file)
+        bookmark_manager.add_bookmarks(
+            [
+                Bookmark("first", "https://first.com", "One"),
+                Bookmark("second", "https://second.com"),
+            ],
+        )
+
+        launcher = BookmarkLauncher(file_manager, bookmark_file)
+        assert launcher.list_bookmarks() is True
+
+        assert capsys.readouterr().out == (
+            "NAME|DESCRIPTION|URL\n"
+            "--------------------\n"
+            "First|One|https://first.com\n"
+            "Second||https://second.com\n"
+        )
+
+    @patch("bookmark.bookmark_launcher.shutil.which")
+    @patch("bookmark.bookmark_launcher.subprocess.Popen")
+    @patch("bookmark.bookmark_launcher.get_fzf_interface")
+    def test_launch_url_custom_browser_detached(
+        self, mock_get_fzf, mock_popen, mock_which, file_manager, bookmark_file
+    ):
+        """Test a custom browser is started detached without waiting on it."""
+        mock_which.return_value = "/usr/bin/firefox"
+        launcher = BookmarkLauncher(file_manager, bookmark_file, "firefox --new-tab")
+
+        assert launcher._launch_url("https://example.com") is True
+        assert launcher._launch_url("https://example.org") is True
+
+        args, kwargs = mock_popen.call_args
+        assert args[0] == ["/usr/bin/firefox", "--new-tab", "https://example.org"]
+        assert kwargs["start_new_session"] is True
+        mock_popen.return_value.wait.assert_not_called()
+
+        # The PATH lookup is done once and reused
+        mock_which.assert_called_once_with("firefox")
+
+    @patch("bookmark.bookmark_launcher.get_fzf_interface")
+    def test_launch_url_missing_browser(
+        self, mock_get_fzf, file_manager, bookmark_file
+    ):
+        """Test a missing custom browser command is reported as a failure."""
+        launcher = BookmarkLauncher(
+            file_manager, bookmark_file, "no-such-browser-command"
+        )
+
+        with patch("bookmark.bookmark_launcher.subprocess.Popen") as mock_popen:
+            assert launcher._launch_url("https://example.com") is False
+
+        # The missing command is caught before any process is spawned
+        mock_popen.assert_not_called()
+
+    @patch("bookmark.bookmark_launcher.get_fzf_interface")
+    def test_prepare_browser_ignores_malformed_command(
+        self, mock_get_fzf, file_manager, bookmark_file, capsys
+    ):
+        """Test browser warm-up stays silent and leaves errors to the launch."""
+        launcher = BookmarkLauncher(file_manager, bookmark_file, 'firefox "')
+
+        # Runs while FZF is open, so it must neither raise nor print
+        launcher._prepare_browser()
+        assert capsys.readouterr() == ("", "")
+
+        with patch("bookmark.bookmark_launcher.subprocess.Popen") as mock_popen:
+            assert launcher._launch_url("https://example.com") is False
+
+        mock_popen.assert_not_called()
+        assert "No closing quotation" in capsys.readouterr().err
 
     def test_bookmark_display_formatting(self, file_manager, bookmark_file):
         """Test bookmark display formatting with different field configurations."""
         # Create test bookmarks
-        from bookmark.models import Bookmark
-
         bookmark = Bookmark(
             name="test site",
             url="https://test.com",
@@ -186,12 +351,13 @@ class TestBookmarkIntegration:
         """Test recovery from malformed bookmark entries."""
         # Create file with mixed valid and invalid entries
         bookmark_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(bookmark_file, "w") as f:
-            f.write("Valid Site|https://valid.com|Good entry|web\n")
-            f.write("Invalid Entry\n")  # Malformed
-            f.write("\n")  # Blank line
-            f.write("Another Valid|https://valid2.com||test\n")
-            f.write("Too|Many|Fields|Here|Extra|Fields\n")  # Malformed
+        bookmark_file.write_bytes(
+            b"Valid Site|https://valid.com|Good entry|web\n"
+            b"Invalid Entry\n"  # Malformed
+            b"\n"  # Blank line
+            b"Another Valid|https://valid2.com||test\n"
+            b"Too|Many|Fields|Here|Extra|Fields\n",  # Malformed
+        )
 
         bookmark_manager = BookmarkManager(bookmark_file)
         bookmarks = bookmark_manager.read_bookmarks()
@@ -201,10 +367,8 @@ class TestBookmarkIntegration:
         assert bookmarks[0].name == "Valid Site"
         assert bookmarks[1].name == "Another Valid"
 
-    def test_unicode_handling(self, file_manager, bookmark_file):
+    def test_unicode_handling(self, file_manager, bookmark_manager):
         """Test handling of unicode characters in bookmarks."""
-        from bookmark.models import Bookmark
-
         # Create bookmark with unicode characters
         unicode_bookmark = Bookmark(
             name="测试网站",  # Chinese characters
@@ -213,7 +377,6 @@ class TestBookmarkIntegration:
             tags="тест,网站",
         )
 
-        bookmark_manager = BookmarkManager(bookmark_file)
         bookmark_manager.ensure_file_exists()
         bookmark_manager.add_bookmark(unicode_bookmark)
 
@@ -228,24 +391,26 @@ class TestBookmarkIntegration:
         assert "тест" in saved_bookmark.tags
         assert "网站" in saved_bookmark.tags
 
-    @patch("builtins.input")
-    def test_bookmark_creator_workflow(self, mock_input, file_manager, bookmark_file):
+    def test_bookmark_creator_workflow(self, file_manager, bookmark_manager):
         """Test the bookmark creation workflow."""
-        # Mock user inputs
-        mock_input.side_effect = [
-            "My Test Site",  # name
-            "https://example.com",  # url
-            "A test site for integration testing",  # description
-            "testing,integration,web",  # tags
-        ]
+        # Feed user inputs from a plain iterator rather than a MagicMock
+        answers = iter(
+            [
+                "My Test Site",  # name
+                "https://example.com",  # url
+                "A test site for integration testing",  # description
+                "testing,integration,web",  # tags
+            ],
+        )
 
-        creator = BookmarkCreator(file_manager, bookmark_file)
-        success = creator.create_bookmark()
+        creator = BookmarkCreator(file_manager, bookmark_manager=bookmark_manager)
+        with patch("builtins.input", lambda _prompt="": next(answers)):
+            success = creator.create_bookmark()
 
         assert success is True
+        assert creator.bookmark_file == bookmark_manager.bookmark_file
 
         # Verify bookmark was created
-        bookmark_manager = BookmarkManager(bookmark_file)
         bookmarks = bookmark_manager.read_bookmarks()
 
         assert len(bookmarks) == 1
@@ -255,24 +420,41 @@ class TestBookmarkIntegration:
         assert bookmark.description == "A test site for integration testing"
         assert bookmark.tags == "integration,testing,web"  # Should be sorted
 
-    @patch("builtins.input")
-    def test_bookmark_creator_name_validation(
-        self, mock_input, file_manager, bookmark_file
+    @patch("bookmark.bookmark_creator.get_fzf_interface")
+    def test_bookmark_creator_rejects_mismatched_manager(
+        self, mock_get_fzf, file_manager, bookmark_manager, temp_test_dir
     ):
+        """Test a manager for another file cannot be combined with a path."""
+        other_file = temp_test_dir / "other_bookmarks.txt"
+        with pytest.raises(ValueError, match="bookmark_manager uses"):
+            BookmarkCreator(file_manager, other_file, bookmark_manager)
+
+        # The manager's own path is accepted
+        creator = BookmarkCreator(
+            file_manager, bookmark_manager.bookmark_file, bookmark_manager
+        )
+        assert creator.bookmark_manager is bookmark_manager
+
+    def test_bookmark_creator_name_validation(self, file_manager, bookmark_manager):
         """Test bookmark creator handles invalid names."""
-        # Mock user inputs - first input has pipe, second is valid
-        mock_input.side_effect = [
-            "My|Invalid|Name",  # invalid name with pipes
-            "My Valid Name",  # valid name
-            "https://example.com",  # url
-            "",  # description (empty)
-            "",  # tags (empty)
-        ]
+        # User inputs - first input has pipe, second is valid
+        answers = iter(
+            [
+                "My|Invalid|Name",  # invalid name with pipes
+                "My Valid Name",  # valid name
+                "https://example.com",  # url
+                "",  # description (empty)
+                "",  # tags (empty)
+            ],
+        )
 
-        creator = BookmarkCreator(file_manager, bookmark_file)
+        creator = BookmarkCreator(file_manager, bookmark_manager=bookmark_manager)
 
         # Mock print to capture validation message
-        with patch("builtins.print") as mock_print:
+        with (
+            patch("builtins.input", lambda _prompt="": next(answers)),
+            patch("builtins.print") as mock_print,
+        ):
             success = creator.create_bookmark()
 
         assert success is True
@@ -283,7 +465,6 @@ class TestBookmarkIntegration:
         )
 
         # Verify bookmark was created with valid name
-        bookmark_manager = BookmarkManager(bookmark_file)
         bookmarks = bookmark_manager.read_bookmarks()
         assert len(bookmarks) == 1
         assert bookmarks[0].name == "My Valid Name"
@@ -1,11 +1,14 @@
 """Tests for bookmark models and validation."""
 
 import pytest
-from pathlib import Path
-import tempfile
-import shutil
 
-from bookmark.models import Bookmark, BookmarkManager
+from bookmark.models import (
+    Bookmark,
+    BookmarkManager,
+    _display_formatter,
+    _normalize_tags,
+    _parse_line_fields,
+)
 
 
 class TestBookmark:
@@ -56,39 +59,84 @@ class TestBookmark:
         assert bookmark.description == ""
         assert bookmark.tags == ""
 
+    def test_bookmark_uses_slots(self):
+        """Test bookmarks store fields in slots rather than a per-instance dict."""
+        bookmark = Bookmark(name="simple site", url="https://simple.com")
+
+        assert not hasattr(bookmark, "__dict__")
+        with pytest.raises(AttributeError):
+            bookmark.extra = "value"
+
     def test_name_validation_pipe_character(self):
         """Test that pipe characters in names raise ValueError."""
         with pytest.raises(ValueError, match="Name cannot contain pipe characters"):
             Bookmark(name="My|Site", url="https://example.com")
 
-    def test_name_title_case_normalization(self):
-        """Test various name formats are converted to title case."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        ("input_name", "expected"),
+        [
             ("my test site", "My Test Site"),
             ("MY TEST SITE", "My Test Site"),
             ("mY tEsT sItE", "My Test Site"),
             ("test", "Test"),
             ("TEST", "Test"),
-        ]
+        ],
+    )
+    def test_name_title_case_normalization(self, input_name, expected):
+        """Test various name formats are converted to title case."""
+        bookmark = Bookmark(name=input_name, url="https://example.com")
+        assert bookmark.name == expected
+
+    def test_name_title_case_non_ascii(self):
+        """Test non-ASCII names are title cased even when istitle() agrees."""
+        # "Ǆ".istitle() is True but its title-case form is the digraph "ǅ"
+        bookmark = Bookmark(name="Ǆemal", url="https://example.com")
+        assert bookmark.name == "ǅemal"
+
+    def test_unicode_fields_nfc_normalized(self):
+        """Test decomposed input is stored in composed (NFC) form."""
+        decomposed = "Cafe\u0301"  # "e" followed by a combining acute accent
+        bookmark = Bookmark(
+            name=decomposed,
+            url="https://cafe.com",
+            description=decomposed,
+            tags=decomposed,
+        )
 
-        for input_name, expected in test_cases:
-            bookmark = Bookmark(name=input_name, url="https://example.com")
-            assert bookmark.name == expected
+        assert bookmark.name == "Caf\u00e9"
+        assert bookmark.description == "Caf\u00e9"
+        assert bookmark.tags == "caf\u00e9"
 
-    def test_tag_normalization(self):
-        """Test tag normalization: lowercase, sorted, deduplicated."""
-        test_cases = [
+    def test_from_line_nfc_normalizes_description(self):
+        """Test canonical lines still get an NFC description."""
+        bookmark = Bookmark.from_line("Cafe|https://cafe.com|Cafe\u0301|")
+        assert bookmark.description == "Caf\u00e9"
+
+    @pytest.mark.parametrize(
+        ("input_tags", "expected"),
+        [
             (" Testing , WEB , Code ", "code,testing,web"),
             ("web,testing,web,code,testing", "code,testing,web"),
             ("WEB,TESTING", "testing,web"),
             ("", ""),
             ("  ", ""),
             ("single", "single"),
-        ]
+        ],
+    )
+    def test_tag_normalization(self, input_tags, expected):
+        """Test tag normalization: lowercase, sorted, deduplicated."""
+        bookmark = Bookmark(name="Test", url="https://example.com", tags=input_tags)
+        assert bookmark.tags == expected
+
+    def test_tag_normalization_is_memoized(self):
+        """Test that repeated tag strings reuse the cached normalization."""
+        _normalize_tags.cache_clear()
+
+        first = Bookmark(name="One", url="https://one.com", tags="Web, Python")
+        second = Bookmark(name="Two", url="https://two.com", tags="Web, Python")
 
-        for input_tags, expected in test_cases:
-            bookmark = Bookmark(name="Test", url="https://example.com", tags=input_tags)
-            assert bookmark.tags == expected
+        assert first.tags == second.tags == "python,web"
+        assert _normalize_tags.cache_info().hits == 1
 
     def test_to_line_format(self):
         """Test conversion to pipe-delimited line format."""
@@ -131,18 +179,44 @@ class TestBookmark:
         assert bookmark.description == ""
         assert bookmark.tags == ""
 
-    def test_from_line_invalid_format(self):
-        """Test that invalid line formats raise ValueError."""
-        invalid_lines = [
+    @pytest.mark.parametrize(
+        "line",
+        [
             "name|url",  # Too few fields
             "name|url|desc|tags|extra",  # Too many fields
             "",  # Empty line
             "single_field",  # No pipes
-        ]
+        ],
+    )
+    def test_from_line_invalid_format(self, line):
+        """Test that invalid line formats raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid bookmark format"):
+            Bookmark.from_line(line)
 
-        for line in invalid_lines:
+    def test_from_line_caches_valid_lines_only(self):
+        """Test that repeated lines reuse a parse while bad lines still raise."""
+        _parse_line_fields.cache_clear()
+        line = "Test Site|https://test.com|Description|tag"
+
+        assert Bookmark.from_line(line) == Bookmark.from_line(line)
+        assert _parse_line_fields.cache_info().hits == 1
+
+        for _ in range(2):
             with pytest.raises(ValueError, match="Invalid bookmark format"):
-                Bookmark.from_line(line)
+                Bookmark.from_line("name|url")
+        assert _parse_line_fields.cache_info().currsize == 1
+
+    def test_from_line_reports_field_count(self):
+        """Test that the error reports every field, not just the first five."""
+        with pytest.raises(ValueError, match="expected 4 fields, got 7"):
+            Bookmark.from_line("a|b|c|d|e|f|g")
+
+    def test_from_line_normalizes_fields(self):
+        """Test that non-canonical lines are normalized when parsed."""
+        bookmark = Bookmark.from_line("test site|https://test.com||Web, Test\n")
+
+        assert bookmark.name == "Test Site"
+        assert bookmark.tags == "test,web"
 
     def test_matches_display_format(self):
         """Test formatting bookmark for display with specific fields."""
@@ -169,25 +243,39 @@ class TestBookmark:
         result = bookmark.matches_display_format(["name", "invalid", "url"])
         assert result == "Test Site||https://test.com"
 
+        # Single and empty field lists
+        assert bookmark.matches_display_format(["url"]) == "https://test.com"
+        assert bookmark.matches_display_format([]) == ""
+
+    def test_matches_display_format_reuses_formatter(self):
+        """Test that list and tuple field layouts share one cached formatter."""
+        bookmark = Bookmark(name="Test Site", url="https://test.com")
+        other = Bookmark(name="Other Site", url="https://other.com")
+        _display_formatter.cache_clear()
+
+        assert bookmark.matches_display_format(("name", "url")) == (
+            "Test Site|https://test.com"
+        )
+        assert other.matches_display_format(["name", "url"]) == (
+            "Other Site|https://other.com"
+        )
+        assert _display_formatter.cache_info().misses == 1
+
 
 class TestBookmarkManager:
     """Test the BookmarkManager class."""
 
     @pytest.fixture
-    def temp_bookmark_file(self):
+    def temp_bookmark_file(self, tmp_path):
         """Create a temporary bookmark file for testing."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-            temp_path = Path(f.name)
-        yield temp_path
-        if temp_path.exists():
-            temp_path.unlink()
+        temp_path = tmp_path / "bookmarks.txt"
+        temp_path.touch()
+        return temp_path
 
     @pytest.fixture
-    def temp_dir(self):
+    def temp_dir(self, tmp_path):
         """Create a temporary directory for testing."""
-        temp_dir = Path(tempfile.mkdtemp())
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+        return tmp_path
 
     def test_read_empty_file(self, temp_bookmark_file):
         """Test reading from an empty bookmark file."""
@@ -207,12 +295,13 @@ class TestBookmarkManager:
 
     def test_read_bookmarks_with_blank_lines(self, temp_bookmark_file):
         """Test that blank lines are ignored when reading bookmarks."""
-        with open(temp_bookmark_file, "w") as f:
-            f.write("Test Site|https://test.com|Description|tag\n")
-            f.write("\n")  # Blank line
-            f.write("   \n")  # Line with only spaces
-            f.write("Another Site|https://another.com||other\n")
-            f.write("\n")  # Another blank line
+        temp_bookmark_file.write_bytes(
+            b"Test Site|https://test.com|Description|tag\n"
+            b"\n"  # Blank line
+            b"   \n"  # Line with only spaces
+            b"Another Site|https://another.com||other\n"
+            b"\n",  # Another blank line
+        )
 
         manager = BookmarkManager(temp_bookmark_file)
         bookmarks = manager.read_bookmarks()
@@ -221,9 +310,24 @@ class TestBookmarkManager:
         assert bookmarks[0].name == "Test Site"
         assert bookmarks[1].name == "Another Site"
 
+    def test_read_bookmarks_crlf_line_endings(self, temp_bookmark_file):
+        """Test that CRLF line endings and surrounding spaces are trimmed."""
+        temp_bookmark_file.write_bytes(
+            b"Test Site|https://test.com|Description|tag\r\n"
+            b"  Another Site|https://another.com||other  \r\n",
+        )
+
+        manager = BookmarkManager(temp_bookmark_file)
+        bookmarks = manager.read_bookmarks()
+
+        assert len(bookmarks) == 2
+        assert bookmarks[0].tags == "tag"
+        assert bookmarks[1].name == "Another Site"
+        assert bookmarks[1].tags == "other"
+
     def test_read_bookmarks_with_malformed_entries(self, temp_bookmark_file):
         """Test handling of malformed bookmark entries."""
-        with open(temp_bookmark_file, "w") as f:
+        with open(temp_bookmark_file, "w", encoding="utf-8", newline="") as f:
             f.write("Valid Site|https://valid.com|Description|tag\n")
             f.write("Invalid|Entry\n")  # Malformed - too few fields
             f.write("Another Valid|https://valid2.com||other\n")
@@ -237,6 +341,105 @@ class TestBookmarkManager:
         assert bookmarks[0].name == "Valid Site"
         assert bookmarks[1].name == "Another Valid"
 
+    def test_read_bookmarks_reports_malformed_line_numbers(
+        self, temp_bookmark_file, caplog
+    ):
+        """Test malformed entries are reported with their line numbers."""
+        with open(temp_bookmark_file, "w", encoding="utf-8", newline="") as f:
+            f.write("Valid Site|https://valid.com|Description|tag\n")
+            f.write("\n")  # Blank line still counts towards numbering
+            f.write("Invalid|Entry\n")
+            f.write("Too|Many|Fields|Here|Extra\n")
+
+        manager = BookmarkManager(temp_bookmark_file)
+        bookmarks = manager.read_bookmarks()
+
+        assert len(bookmarks) == 1
+        assert caplog.messages == [
+            "Skipping malformed bookmark on line 3: "
+            "Invalid bookmark format: expected 4 fields, got 2",
+            "Skipping malformed bookmark on line 4: "
+            "Invalid bookmark format: expected 4 fields, got 5",
+        ]
+
+    def test_read_bookmarks_memory_mapped(self, temp_bookmark_file, monkeypatch):
+        """Test that large files read through mmap parse the same way."""
+        monkeypatch.setattr("bookmark.models._MMAP_THRESHOLD", 1)
+        temp_bookmark_file.write_bytes(
+            "Test Site|https://test.com|Description|tag\r\n"
+            "Caf\u00e9 Site|https://cafe.com||\n".encode(),
+        )
+
+        manager = BookmarkManager(temp_bookmark_file)
+        bookmarks = manager.read_bookmarks()
+
+        assert [b.name for b in bookmarks] == ["Test Site", "Caf\u00e9 Site"]
+        assert bookmarks[0].tags == "tag"
+
+    def test_read_bookmarks_normalizes_hand_edited_lines(self, temp_bookmark_file):
+        """Test that canonical and hand-edited lines read back normalized."""
+        with open(temp_bookmark_file, "w", encoding="utf-8", newline="") as f:
+            f.write("Test Site|https://test.com|Description|python,web\n")
+            f.write("another site|https://another.com||Web, Python,web\n")
+
+        manager = BookmarkManager(temp_bookmark_file)
+        bookmarks = manager.read_bookmarks()
+
+        assert bookmarks == [
+            Bookmark("Test Site", "https://test.com", "Description", "python,web"),
+            Bookmark("Another Site", "https://another.com", "", "python,web"),
+        ]
+
+    def test_read_bookmarks_shares_tag_strings(self, temp_bookmark_file):
+        """Test that bookmarks with equal tags share one tags string."""
+        with open(temp_bookmark_file, "w", encoding="utf-8", newline="") as f:
+            f.write("First Site|https://first.com||python,web\n")
+            f.write("Second Site|https://second.com||python,web\n")
+
+        manager = BookmarkManager(temp_bookmark_file)
+        first, second = manager.read_bookmarks()
+
+        assert first.tags is second.tags
+
+    def test_iter_bookmarks_is_lazy(self, temp_bookmark_file):
+        """Test that iter_bookmarks yields bookmarks one at a time."""
+        with open(temp_bookmark_file, "w", encoding="utf-8", newline="") as f:
+            f.write("First Site|https://first.com||\n")
+            f.write("Second Site|https://second.com||\n")
+
+        manager = BookmarkManager(temp_bookmark_file)
+        bookmarks = manager.iter_bookmarks()
+
+        assert next(bookmarks).name == "First Site"
+        assert next(bookmarks).name == "Second Site"
+        assert next(bookmarks, None) is None
+
+    def test_read_bookmark_columns(self, temp_bookmark_file):
+        """Test reading bookmarks as normalized, index-aligned columns."""
+        with open(temp_bookmark_file, "w", encoding="utf-8", newline="") as f:
+            f.write("test site|https://test.com|Description|Web,Test\n")
+            f.write("Malformed line without pipes\n")
+            f.write("Another Site|https://another.com||\n")
+            # Decomposed "é" (e + combining acute accent)
+            f.write("Cafe|https://cafe.com|Cafe\u0301|\n")
+
+        manager = BookmarkManager(temp_bookmark_file)
+        names, urls, descriptions, tags = manager.read_bookmark_columns()
+
+        assert names == ["Test Site", "Another Site", "Cafe"]
+        assert urls == ["https://test.com", "https://another.com", "https://cafe.com"]
+        assert descriptions == ["Description", "", "Caf\u00e9"]
+        assert tags == ["test,web", "", ""]
+
+        # Columns match what read_bookmarks() yields field for field
+        bookmarks = manager.read_bookmarks()
+        assert descriptions == [bookmark.description for bookmark in bookmarks]
+
+    def test_read_bookmark_columns_missing_file(self, temp_dir):
+        """Test that a missing file yields empty columns."""
+        manager = BookmarkManager(temp_dir / "nonexistent.txt")
+        assert manager.read_bookmark_columns() == ([], [], [], [])
+
     def test_add_bookmark(self, temp_bookmark_file):
         """Test adding a bookmark to a file."""
         manager = BookmarkManager(temp_bookmark_file)
@@ -250,7 +453,7 @@ class TestBookmarkManager:
         manager.add_bookmark(bookmark)
 
         # Verify bookmark was added
-        with open(temp_bookmark_file, "r") as f:
+        with open(temp_bookmark_file, encoding="utf-8", newline="") as f:
             content = f.read().strip()
             assert content == "Test Site|https://test.com|A test|test,web"
 
@@ -270,13 +473,41 @@ class TestBookmarkManager:
         assert bookmarks[0].name == "First Site"
         assert bookmarks[1].name == "Second Site"
 
+    def test_add_bookmarks_batch(self, temp_bookmark_file):
+        """Test appending several bookmarks in one call preserves order."""
+        manager = BookmarkManager(temp_bookmark_file)
+        manager.add_bookmark(Bookmark("existing site", "https://existing.com"))
+
+        manager.add_bookmarks(
+            Bookmark(name, f"https://{name}.com") for name in ["first", "second"]
+        )
+
+        bookmarks = manager.read_bookmarks()
+        assert [b.name for b in bookmarks] == ["Existing Site", "First", "Second"]
+
+    def test_add_bookmark_encodes_utf8(self, temp_bookmark_file):
+        """Test that appended bookmarks are written as UTF-8."""
+        manager = BookmarkManager(temp_bookmark_file)
+        manager.add_bookmark(Bookmark("caf\u00e9", "https://cafe.com", "cr\u00e8me"))
+
+        assert temp_bookmark_file.read_bytes() == (
+            "Caf\u00e9|https://cafe.com|cr\u00e8me|\n".encode()
+        )
+
+    def test_add_bookmarks_empty(self, temp_dir):
+        """Test appending no bookmarks does not create the file."""
+        bookmark_file = temp_dir / "bookmarks.txt"
+        manager = BookmarkManager(bookmark_file)
+
+        manager.add_bookmarks([])
+        assert not bookmark_file.exists()
+
     def test_add_duplicate_bookmarks(self, temp_bookmark_file):
         """Test that duplicate bookmarks are allowed."""
         manager = BookmarkManager(temp_bookmark_file)
         bookmark = Bookmark("same site", "https://same.com", "Same", "duplicate")
 
-        manager.add_bookmark(bookmark)
-        manager.add_bookmark(bookmark)  # Add same bookmark again
+        manager.add_bookmarks([bookmark, bookmark])  # Same bookmark twice
 
         bookmarks = manager.read_bookmarks()
         assert len(bookmarks) == 2
@@ -290,7 +521,8 @@ class TestBookmarkManager:
 
         assert not bookmark_file.exists()
         manager.ensure_file_exists()
-        assert bookmark_file.exists()
+        # A single stat() shows the file exists and was created empty
+        assert bookmark_file.stat().st_size == 0
 
     def test_ensure_file_exists_creates_parent_directories(self, temp_dir):
         """Test that ensure_file_exists creates parent directories."""
@@ -299,8 +531,8 @@ class TestBookmarkManager:
 
         assert not bookmark_file.parent.exists()
         manager.ensure_file_exists()
-        assert bookmark_file.exists()
-        assert bookmark_file.parent.exists()
+        # The file existing implies its parent does, so one stat() covers both
+        assert bookmark_file.stat().st_size == 0
 
     def test_add_bookmark_creates_parent_directories(self, temp_dir):
         """Test that adding a bookmark creates parent directories."""
@@ -310,5 +542,5 @@ class TestBookmarkManager:
         bookmark = Bookmark("test", "https://test.com")
         manager.add_bookmark(bookmark)
 
-        assert bookmark_file.exists()
-        assert bookmark_file.parent.exists()
+        # Reading the file back proves both it and its parent were created
+        assert bookmark_file.read_text() == "Test|https://test.com||\n"